@@ -6,6 +6,8 @@ Run explicitly: pytest examples/ -v
 Note: pyproject.toml sets testpaths=["tests"] so `pytest` alone won't run these.
 """
 
+from pathlib import Path
+
 import pytest
 
 
@@ -16,6 +18,8 @@ def pytest_configure(config):
 
 def pytest_collection_modifyitems(config, items):
     """Mark all items in examples/ with the example marker."""
+    examples_dir = Path(__file__).parent.resolve()
+    mark = pytest.mark.example
     for item in items:
-        if "examples" in str(item.fspath):
-            item.add_marker(pytest.mark.example)
+        if item.path.is_relative_to(examples_dir):
+            item.add_marker(mark)
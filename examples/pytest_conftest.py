@@ -13,8 +13,6 @@ Usage:
     pytest tests/ -k "test_my_feature"  # with parametrized fixture
 """
 
-import os
-
 import pytest
 
 from pytest_llm_assert import LLMAssert
@@ -22,11 +20,14 @@ from pytest_llm_assert import LLMAssert
 
 # Option 1: Simple fixture using CLI options (recommended)
 # The plugin already provides `llm_assert` fixture, but you can customize:
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llm(request):
     """LLM assertion helper with CLI configuration.
 
     Uses --llm-model, --llm-api-key, --llm-api-base from CLI.
+    Session-scoped: LLMAssert is effectively immutable after construction
+    (only `response` mutates, holding the last call's metadata), so one
+    instance can serve the whole run.
     """
     return LLMAssert(
         model=request.config.getoption("--llm-model", "openai/gpt-5-mini"),
@@ -43,7 +44,7 @@ MODELS_TO_TEST = [
 ]
 
 
-@pytest.fixture(params=MODELS_TO_TEST)
+@pytest.fixture(scope="session", params=MODELS_TO_TEST)
 def llm_multi(request):
     """Parametrized fixture that runs tests against multiple models.
 
@@ -55,20 +56,29 @@ def llm_multi(request):
 
 
 # Option 3: Azure with Entra ID authentication
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llm_azure():
     """LLM assertion helper for Azure OpenAI with Entra ID.
 
     Requires:
         pip install pytest-llm-assert[azure]
         export AZURE_OPENAI_ENDPOINT=https://your-resource.openai.azure.com
+
+    Checks configuration before importing azure.identity so unconfigured
+    runs skip without paying the import or credential-chain cost. Session
+    scope means the token is fetched once per run, not per test.
     """
-    from azure.identity import DefaultAzureCredential
+    import os
 
     endpoint = os.environ.get("AZURE_OPENAI_ENDPOINT")
     if not endpoint:
         pytest.skip("AZURE_OPENAI_ENDPOINT not set")
 
+    try:
+        from azure.identity import DefaultAzureCredential
+    except ImportError:
+        pytest.skip("azure-identity not installed")
+
     credential = DefaultAzureCredential()
     token = credential.get_token("https://cognitiveservices.azure.com/.default").token
 
@@ -80,7 +90,7 @@ def llm_azure():
 
 
 # Option 4: Google Vertex AI
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llm_vertex():
     """LLM assertion helper for Google Vertex AI.
 
@@ -88,6 +98,8 @@ def llm_vertex():
         gcloud auth application-default login
         export GCP_PROJECT_ID=your-project-id  # or GOOGLE_CLOUD_PROJECT
     """
+    import os
+
     project = os.environ.get("GOOGLE_CLOUD_PROJECT") or os.environ.get("GCP_PROJECT_ID")
     location = (
         os.environ.get("GOOGLE_CLOUD_LOCATION")
@@ -11,9 +11,13 @@ import pytest
 from pytest_llm_assert import LLMAssert
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llm():
-    """LLM assertion helper - configure via environment or override here."""
+    """LLM assertion helper - configure via environment or override here.
+
+    Session-scoped so one instance (env reads, key expansion, auth setup)
+    serves the whole run instead of being rebuilt per test.
+    """
     import os
 
     model = os.environ.get("LLM_MODEL", "openai/gpt-5-mini")
@@ -24,17 +28,20 @@ class TestSemanticVariations:
     """The hero use case: handling variations that string matching can't."""
 
     def test_success_message_variations(self, llm):
-        """LLM handles success variations that string matching can't."""
+        """LLM handles success variations that string matching can't.
+
+        Uses batch() so all messages are evaluated in a single LLM call.
+        """
         success_messages = [
             "Operation completed successfully",
             "Success!",
             "Done ✓",
             "The task finished without errors",
         ]
-        for msg in success_messages:
-            assert llm(msg, "Does this indicate the operation succeeded?"), (
-                f"Failed: {msg}"
-            )
+        criterion = "Does this indicate the operation succeeded?"
+        results = llm.batch([(msg, criterion) for msg in success_messages])
+        for msg, result in zip(success_messages, results, strict=True):
+            assert result, f"Failed: {msg}"
 
     def test_error_message_variations(self, llm):
         """Different error phrasings should all be recognized."""
@@ -44,25 +51,29 @@ class TestSemanticVariations:
             "Something went wrong",
             "❌ Operation failed",
         ]
-        for msg in error_messages:
-            assert llm(msg, "Does this indicate an error or failure?"), f"Failed: {msg}"
+        criterion = "Does this indicate an error or failure?"
+        results = llm.batch([(msg, criterion) for msg in error_messages])
+        for msg, result in zip(error_messages, results, strict=True):
+            assert result, f"Failed: {msg}"
 
 
 class TestSQLValidation:
     """SQL validation - the README hero example."""
 
     def test_valid_sql_variations(self, llm):
-        """Different valid SQL for same intent should all pass."""
+        """Different valid SQL for same intent should all pass.
+
+        Uses gather() so the queries are evaluated concurrently rather
+        than one blocking HTTP call at a time.
+        """
         valid_queries = [
             "SELECT name FROM users WHERE age > 21",
             "select NAME from USERS where AGE > 21",  # Case insensitive
             "SELECT u.name FROM users u WHERE u.age > 21",  # With alias
         ]
-        for sql in valid_queries:
-            assert llm(
-                sql,
-                "Is this a valid SQL query that selects user names filtered by age?",
-            )
+        criterion = "Is this a valid SQL query that selects user names filtered by age?"
+        results = llm.gather([(sql, criterion) for sql in valid_queries])
+        assert all(results), f"Failed: {[r for r in results if not r]}"
 
     def test_invalid_sql_rejected(self, llm):
         """Invalid SQL should fail."""
@@ -24,7 +24,10 @@ def _get_azure_llm():
     if not endpoint:
         pytest.skip("AZURE_OPENAI_ENDPOINT not set")
 
-    from azure.identity import DefaultAzureCredential
+    try:
+        from azure.identity import DefaultAzureCredential
+    except ImportError:
+        pytest.skip("azure-identity not installed")
 
     credential = DefaultAzureCredential()
     token = credential.get_token("https://cognitiveservices.azure.com/.default").token
@@ -2,30 +2,158 @@
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import hashlib
 import json
 import os
 import re
+import sqlite3
+import time
+from array import array
+from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, ClassVar
 
-import litellm
+try:
+    # Optional C JSON parser (~3-10x faster); install via pytest-llm-assert[fast]
+    import orjson
 
-# Load default system prompt from file
+    _json_loads: Callable[[str], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Recognized pass indicators for line-based fallback parsing
+_PASS_SET = frozenset({"PASS", "YES", "TRUE", "PASSED"})
+
+# Shared suffix for truncated previews
+_ELLIPSIS = "..."
+
+# ${VAR} placeholders in API keys, compiled once
+_ENV_RE = re.compile(r"\$\{([^}]+)\}")
+
+# Verdict/reasoning extraction from (possibly partial) JSON responses
+_VERDICT_RE = re.compile(r'"result"\s*:\s*"(PASS|FAIL)"')
+_REASONING_RE = re.compile(r'"reasoning"\s*:\s*"([^"]*)')
+
+# Strict output schema matching the system prompt's verdict contract.
+# Constrained decoding stops models from generating free-form wrappers
+# around the verdict, trimming output tokens and parse edge cases.
+_VERDICT_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "verdict",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string", "enum": ["PASS", "FAIL"]},
+                "reasoning": {"type": "string"},
+            },
+            "required": ["result", "reasoning"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Completion-token budget per batch item: an array entry runs ~20-25
+# tokens, doubled for verbose reasoning and JSON overhead
+_BATCH_TOKENS_PER_ITEM = 48
+
+# Batch variant: one verdict entry per item. Strict json_schema mode
+# requires an object root, so the array is wrapped in a "results" key;
+# providers without schema support follow the batch prompt and return a
+# bare array instead. batch() accepts both shapes.
+_BATCH_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "batch_verdicts",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": _VERDICT_SCHEMA["json_schema"]["schema"],
+                }
+            },
+            "required": ["results"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Load default system prompts from files
 _PROMPTS_DIR = Path(__file__).parent / "prompts"
 _DEFAULT_SYSTEM_PROMPT = (_PROMPTS_DIR / "system_prompt.md").read_text().strip()
+_BATCH_SYSTEM_PROMPT = (_PROMPTS_DIR / "batch_system_prompt.md").read_text().strip()
 
 if TYPE_CHECKING:
     from typing import Any
 
 
+def __getattr__(name: str) -> Any:
+    """Lazily import litellm on first attribute access.
+
+    Importing litellm pulls in a heavy dependency graph (httpx, tiktoken,
+    tokenizers, ...), which would otherwise be paid during pytest collection
+    even by test runs that never make an LLM call. Deferring the import keeps
+    `import pytest_llm_assert` cheap; `unittest.mock.patch` targets like
+    `pytest_llm_assert.core.litellm.completion` still resolve through here.
+    """
+    if name == "litellm":
+        import litellm
+
+        return litellm
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def empty_content_fails(content: str, criterion: str) -> bool | None:
+    """Stock prefilter: empty or whitespace-only content always fails."""
+    return False if not content.strip() else None
+
+
+@functools.lru_cache(maxsize=256)
+def _expand_env_template(value: str) -> str:
+    """Substitute ${VAR} placeholders from os.environ, memoized."""
+    return _ENV_RE.sub(lambda m: os.environ.get(m.group(1), m.group(0)), value)
+
+
+def _ensure_pooled_session(litellm: Any) -> None:
+    """Install a pooled sync httpx client on litellm, once per process.
+
+    Without a pinned session LiteLLM may open a fresh HTTPS connection
+    per call, paying a TLS handshake each time. A shared client with
+    keep-alive amortizes that to one handshake per provider for the
+    whole run. `client_session` is LiteLLM's own module-level hook, so
+    an existing user-configured session is kept.
+
+    Only the sync client is pinned. Async keep-alive connections are
+    bound to the event loop they were opened on, and every gather()
+    call runs its own short-lived loop via asyncio.run(), so a
+    process-global AsyncClient on `aclient_session` would raise
+    "Event loop is closed" on the second gather(). LiteLLM caches its
+    async clients per running loop for exactly this reason, which
+    already reuses connections within each loop.
+    """
+    import httpx
+
+    if getattr(litellm, "client_session", None) is None:
+        limits = httpx.Limits(max_keepalive_connections=20)
+        litellm.client_session = httpx.Client(timeout=600, limits=limits)
+
+
 @functools.cache
 def _get_azure_ad_token_provider() -> Callable[[], str] | None:
     """Get Azure AD token provider for Entra ID authentication.
 
     Uses LiteLLM's built-in helper which leverages DefaultAzureCredential.
-    Cached at module level to avoid recreating credentials on each call.
+    Cached at module level so the credential probe (IMDS, env, CLI, ...)
+    runs once per process no matter how many instances fixtures build.
+    A single cache slot is enough: the provider doesn't depend on
+    api_base or tenant — DefaultAzureCredential resolves those from the
+    environment when the token is actually fetched.
     """
     try:
         from litellm.secret_managers.get_azure_ad_token_provider import (
@@ -41,6 +169,87 @@ def _get_azure_ad_token_provider() -> Callable[[], str] | None:
         return None
 
 
+class _ResultCache:
+    """SQLite-backed cache of assertion results, keyed by content hash.
+
+    Lives under `.pytest_cache/llm_assert/` by default so `--lf` reruns and
+    repeated runs skip the LLM for pairs that were already evaluated.
+    Entries older than `ttl` seconds are treated as misses.
+    """
+
+    def __init__(self, directory: Path, ttl: int | None = None) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl
+        self._conn = sqlite3.connect(directory / "results.db")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, passed INTEGER, reasoning TEXT, "
+            "created REAL DEFAULT 0)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS vectors "
+            "(key TEXT PRIMARY KEY, vector BLOB, passed INTEGER, "
+            "reasoning TEXT, created REAL DEFAULT 0)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> tuple[bool, str] | None:
+        row = self._conn.execute(
+            "SELECT passed, reasoning, created FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if self._ttl is not None and time.time() - row[2] > self._ttl:
+            return None
+        return bool(row[0]), row[1]
+
+    def set(self, key: str, passed: bool, reasoning: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results (key, passed, reasoning, created) "
+            "VALUES (?, ?, ?, ?)",
+            (key, int(passed), reasoning, time.time()),
+        )
+        self._conn.commit()
+
+    def get_nearest(
+        self, vector: list[float], threshold: float
+    ) -> tuple[bool, str] | None:
+        """Return the cached result whose embedding is closest to `vector`.
+
+        Brute-force scan: stored vectors are unit-normalized, so a dot
+        product is cosine similarity. Test-suite caches hold at most a
+        few thousand entries, where a linear pass beats maintaining an
+        approximate-nearest-neighbor index.
+        """
+        best_score = threshold
+        best: tuple[bool, str] | None = None
+        now = time.time()
+        for blob, passed, reasoning, created in self._conn.execute(
+            "SELECT vector, passed, reasoning, created FROM vectors"
+        ):
+            if self._ttl is not None and now - created > self._ttl:
+                continue
+            stored = array("f")
+            stored.frombytes(blob)
+            if len(stored) != len(vector):
+                continue  # embedding model changed
+            score = sum(a * b for a, b in zip(stored, vector, strict=True))
+            if score >= best_score:
+                best_score = score
+                best = (bool(passed), reasoning)
+        return best
+
+    def set_vector(
+        self, key: str, vector: list[float], passed: bool, reasoning: str
+    ) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO vectors "
+            "(key, vector, passed, reasoning, created) VALUES (?, ?, ?, ?, ?)",
+            (key, array("f", vector).tobytes(), int(passed), reasoning, time.time()),
+        )
+        self._conn.commit()
+
+
 @dataclass(slots=True)
 class LLMResponse:
     """Response details from the last LLM call.
@@ -57,9 +266,15 @@ class LLMResponse:
     created: int | None = None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class AssertionResult:
-    """Result of an LLM assertion with rich repr for pytest."""
+    """Result of an LLM assertion with rich repr for pytest.
+
+    Frozen and slotted: results are immutable once evaluated (safe to
+    hash, cache, and share across tasks) and carry no per-instance
+    __dict__. The pretty multi-line repr is only built when pytest
+    actually prints a failure.
+    """
 
     passed: bool
     criterion: str
@@ -89,11 +304,25 @@ class LLMAssert:
         >>> llm = LLMAssert(model="azure/gpt-4o", api_base="https://your-resource.openai.azure.com")
     """
 
+    # Class-level defaults: shared across instances and overridable in
+    # subclasses (class MyAssert(LLMAssert): _SYSTEM_PROMPT = "...")
+    _SYSTEM_PROMPT: ClassVar[str] = _DEFAULT_SYSTEM_PROMPT
+    _BATCH_PROMPT: ClassVar[str] = _BATCH_SYSTEM_PROMPT
+
     def __init__(
         self,
         model: str = "openai/gpt-5-mini",
         api_key: str | None = None,
         api_base: str | None = None,
+        cache: bool | Path = False,
+        cache_ttl: int | None = None,
+        semantic_cache: bool = False,
+        similarity_threshold: float = 0.95,
+        embedding_model: str = "text-embedding-3-small",
+        max_concurrency: int = 8,
+        fast_fail: bool = False,
+        max_content_tokens: int | None = 4096,
+        prefilters: list[Callable[[str, str], bool | None]] | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize LLM assertion helper.
@@ -103,15 +332,68 @@ class LLMAssert:
             api_key: API key (supports ${ENV_VAR} expansion).
                 For Azure, leave empty to use Entra ID.
             api_base: Custom API base URL (required for Azure)
-            **kwargs: Additional parameters passed to LiteLLM
+            cache: Cache assertion results on disk. True uses
+                `.pytest_cache/llm_assert/`; a Path uses that directory.
+            cache_ttl: Seconds before cached results expire. None keeps
+                them until the model or system prompt changes.
+            semantic_cache: Also reuse cached verdicts for *semantically*
+                similar (content, criterion) pairs, matched by embedding
+                similarity. Embeddings are ~100x cheaper than completions.
+                Opt-in: near-matches can occasionally be wrong, so this
+                suits dev-loop iteration more than CI. Implies `cache`.
+            similarity_threshold: Minimum cosine similarity for a
+                semantic cache hit.
+            embedding_model: LiteLLM model used to embed pairs when
+                `semantic_cache` is enabled.
+            max_concurrency: Maximum concurrent LLM calls made by `gather()`
+            fast_fail: Stream responses and stop reading as soon as the
+                verdict is decoded; reasoning may be truncated.
+            max_content_tokens: Token budget for content sent to the LLM.
+                Oversized content is head/tail-trimmed with a truncation
+                marker. None disables trimming.
+            prefilters: Cheap (content, criterion) deciders tried before
+                the LLM. Return True/False to settle the assertion without
+                a call, or None to fall through to the next filter.
+            **kwargs: Additional parameters passed to LiteLLM. Defaults to
+                temperature=0 (deterministic, cache-friendly verdicts) and
+                max_tokens=128 (a verdict plus brief reasoning); pass your
+                own values to override.
         """
         self.model = model
         self.api_key = self._expand_env(api_key) if api_key else None
         self.api_base = api_base
         self.kwargs = kwargs
+        # Deterministic short verdicts: temperature=0 keeps results stable
+        # across reruns (and cacheable); max_tokens caps decode latency.
+        # Higher max_tokens buys more verbose reasoning at higher latency.
+        self.kwargs.setdefault("temperature", 0)
+        # Remember whether the cap is ours: batch() scales the default
+        # with item count but leaves user-chosen values alone
+        self._default_max_tokens = "max_tokens" not in kwargs
+        self.kwargs.setdefault("max_tokens", 128)
+        self.max_concurrency = max_concurrency
+        self.fast_fail = fast_fail
+        self.max_content_tokens = max_content_tokens
+        self.prefilters = prefilters or []
+        self._json_response_supported: bool | None = None
+        # Snapshot once; avoids re-reading os.environ on every check
+        self._has_azure_key = bool(self.api_key or os.environ.get("AZURE_API_KEY"))
+        self.semantic_cache = semantic_cache
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        if cache is True or (semantic_cache and not cache):
+            cache = Path(".pytest_cache") / "llm_assert"
+        self._cache = _ResultCache(cache, ttl=cache_ttl) if cache else None
         self._azure_ad_token_provider: Callable[[], str] | None = None
-        self._system_prompt: str = _DEFAULT_SYSTEM_PROMPT
-        self.response: LLMResponse | None = None
+        self._system_msg: dict[str, Any] = self._make_system_msg(self._SYSTEM_PROMPT)
+        self._batch_system_msg: dict[str, Any] = self._make_system_msg(
+            self._BATCH_PROMPT
+        )
+        # Context-local so concurrent tasks sharing one instance (gather(),
+        # session-scoped fixtures) each see their own last call
+        self._response_var: ContextVar[LLMResponse | None] = ContextVar(
+            "llm_assert_response", default=None
+        )
 
         # Auto-configure Azure Entra ID when no API key is provided
         if self._is_azure_model() and not self._has_azure_api_key():
@@ -121,14 +403,54 @@ class LLMAssert:
         """Check if the model is an Azure OpenAI model."""
         return self.model.startswith("azure/")
 
+    def _supports_cache_control(self) -> bool:
+        """Check if the model honors explicit prompt-caching markers."""
+        return self.model.startswith(
+            ("anthropic/", "bedrock/anthropic.", "vertex_ai/claude")
+        )
+
+    def _make_system_msg(self, prompt: str) -> dict[str, Any]:
+        """Build the system message, marking it cacheable where supported.
+
+        Anthropic-family models reuse the server-side KV cache for prefixes
+        tagged with cache_control, cutting input cost and time-to-first-token
+        on every assertion after the first. OpenAI/Azure cache long static
+        prefixes automatically, so they get the plain string form.
+        """
+        if self._supports_cache_control():
+            return {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            }
+        return {"role": "system", "content": prompt}
+
     def _has_azure_api_key(self) -> bool:
-        """Check if an Azure API key is available."""
-        return bool(self.api_key or os.environ.get("AZURE_API_KEY"))
+        """Check if an Azure API key was available at construction time."""
+        return self._has_azure_key
+
+    @property
+    def response(self) -> LLMResponse | None:
+        """Details of the last LLM call made in the current context.
+
+        Backed by a ContextVar, so concurrently gathered tasks each see
+        the response of their own call rather than racing on shared state.
+        """
+        return self._response_var.get()
+
+    @response.setter
+    def response(self, value: LLMResponse | None) -> None:
+        self._response_var.set(value)
 
     @property
     def system_prompt(self) -> str:
         """Get the system prompt used for LLM assertions."""
-        return self._system_prompt
+        return self._SYSTEM_PROMPT
 
     @system_prompt.setter
     def system_prompt(self, value: str) -> None:
@@ -137,29 +459,278 @@ class LLMAssert:
         The prompt should instruct the LLM to evaluate content against a criterion
         and respond in JSON format with 'result' (PASS/FAIL) and 'reasoning' keys.
         """
-        self._system_prompt = value
+        # Instance attribute shadows the class-level default
+        self._SYSTEM_PROMPT = value
+        self._system_msg = self._make_system_msg(value)
 
     @staticmethod
     def _expand_env(value: str) -> str:
-        """Expand ${VAR} patterns in string."""
-        pattern = r"\$\{([^}]+)\}"
-        return re.sub(pattern, lambda m: os.environ.get(m.group(1), m.group(0)), value)
+        """Expand ${VAR} patterns in string.
+
+        Expansion is memoized per template: configured templates repeat
+        across instances within a run, and env vars are set before the
+        run starts. Call `_expand_env_template.cache_clear()` after
+        mutating os.environ mid-process (tests do this automatically).
+        """
+        if "${" not in value:
+            return value
+        return _expand_env_template(value)
+
+    def _bound_content(self, content: str) -> str:
+        """Trim content to the configured token budget, if any.
+
+        Keeps the head and tail (70/30 split) with an explicit truncation
+        marker, since assertions usually only need a representative
+        snippet. One token is always at least one character, so content
+        shorter than the budget in characters skips token counting.
+        """
+        if self.max_content_tokens is None or len(content) <= self.max_content_tokens:
+            return content
+
+        import litellm  # deferred; heavy import paid on first call only
+
+        tokens = litellm.token_counter(model=self.model, text=content)
+        if tokens <= self.max_content_tokens:
+            return content
+
+        keep = int(len(content) * self.max_content_tokens / tokens)
+        head = int(keep * 0.7)
+        tail = keep - head
+        return f"{content[:head]}\n...[content truncated]...\n{content[-tail:]}"
+
+    def _build_messages(self, content: str, criterion: str) -> list[dict[str, Any]]:
+        """Build the messages payload for a single assertion.
+
+        The system message dict is cached on the instance; only the user
+        message is allocated per call. Content over the token budget is
+        trimmed here.
+        """
+        content = self._bound_content(content)
+        return [
+            self._system_msg,
+            {
+                "role": "user",
+                "content": f"Criterion: {criterion}\n\nContent:\n{content}",
+            },
+        ]
+
+    def _parse_verdict(self, response_text: str) -> tuple[bool, str]:
+        """Parse an LLM response into (passed, reasoning)."""
+        data = self._loads_json(response_text)
+        if isinstance(data, dict):
+            # Schema-constrained outputs are already uppercase; only pay
+            # the .upper() allocation for nonconforming replies
+            result = data.get("result", "")
+            passed = result == "PASS" or result.upper() == "PASS"
+            return passed, data.get("reasoning", "")
+
+        # Partial JSON (e.g. an abandoned fast_fail stream): extract by regex
+        if verdict := _VERDICT_RE.search(response_text):
+            reasoning_match = _REASONING_RE.search(response_text)
+            reasoning = reasoning_match.group(1) if reasoning_match else ""
+            return verdict.group(1) == "PASS", reasoning
+
+        # Fallback to line-based parsing
+        lines = response_text.strip().split("\n", 1)
+        head = lines[0].strip()
+        passed = head in _PASS_SET or head.upper() in _PASS_SET
+        reasoning = lines[1].strip() if len(lines) > 1 else response_text
+        return passed, reasoning
+
+    @classmethod
+    def _loads_json(cls, response_text: str) -> Any:
+        """Parse LLM output as JSON, or return None if it isn't JSON.
+
+        A cheap first-character check routes bare JSON ('{'/'[') and
+        fenced blocks ('```') before any parse attempt, so plain-text
+        verdicts like "PASS" no longer pay for two raised-and-caught
+        JSONDecodeErrors on every call.
+        """
+        stripped = response_text.lstrip()
+        if stripped.startswith(("{", "[")):
+            try:
+                return _json_loads(response_text)
+            except json.JSONDecodeError:
+                return None
+        if stripped.startswith("```"):
+            try:
+                return _json_loads(cls._strip_code_fence(response_text))
+            except json.JSONDecodeError:
+                return None
+        return None
+
+    def _run_prefilters(self, content: str, criterion: str) -> AssertionResult | None:
+        """Try cheap Python deciders before paying for an LLM call."""
+        for prefilter in self.prefilters:
+            verdict = prefilter(content, criterion)
+            if verdict is not None:
+                name = getattr(prefilter, "__name__", repr(prefilter))
+                return AssertionResult(
+                    passed=verdict,
+                    criterion=criterion,
+                    reasoning=f"Decided by prefilter: {name}",
+                    content_preview=self._truncate(content),
+                )
+        return None
+
+    def _cache_key(self, content: str, criterion: str) -> str:
+        """Content-addressable cache key for one (content, criterion) pair.
+
+        Includes model and full system prompt so changing either implicitly
+        invalidates old entries. blake2b is the fastest stdlib hash and a
+        16-byte digest is plenty for a local cache namespace.
+        """
+        raw = f"{self.model}\x00{self._SYSTEM_PROMPT}\x00{content}\x00{criterion}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _embed(self, content: str, criterion: str) -> list[float] | None:
+        """Embed one (content, criterion) pair for semantic cache lookup.
+
+        Returns a unit-normalized vector, or None when embedding fails -
+        the caller then falls back to a plain LLM call.
+        """
+        import litellm  # deferred; heavy import paid on first call only
+
+        try:
+            response = litellm.embedding(
+                model=self.embedding_model,
+                input=[f"{criterion}\n\n{content}"],
+                api_key=self.api_key,
+            )
+            vector = response.data[0]["embedding"]
+        except Exception:
+            return None
+        norm = sum(v * v for v in vector) ** 0.5
+        return [v / norm for v in vector] if norm else None
+
+    async def _aembed(self, content: str, criterion: str) -> list[float] | None:
+        """Async variant of `_embed` using `litellm.aembedding`."""
+        import litellm  # deferred; heavy import paid on first call only
+
+        try:
+            response = await litellm.aembedding(
+                model=self.embedding_model,
+                input=[f"{criterion}\n\n{content}"],
+                api_key=self.api_key,
+            )
+            vector = response.data[0]["embedding"]
+        except Exception:
+            return None
+        norm = sum(v * v for v in vector) ** 0.5
+        return [v / norm for v in vector] if norm else None
+
+    @staticmethod
+    def _strip_code_fence(text: str) -> str:
+        """Strip a markdown code fence wrapping an LLM response, if present."""
+        text = text.strip()
+        if text.startswith("```"):
+            text = text.split("```")[1]
+            if text.startswith("json"):
+                text = text[4:]
+        return text.strip()
 
     @staticmethod
     def _truncate(text: str, max_len: int = 100) -> str:
-        """Truncate text for display."""
-        if len(text) <= max_len:
-            return text
-        return text[: max_len - 3] + "..."
+        """Truncate text for display.
 
-    def _call_llm(self, messages: list[dict[str, str]]) -> str:
-        """Call the LLM and return response content. Updates self.response."""
+        Short text is returned as-is (no copy); long text pays exactly
+        one slice plus one concat with the shared ellipsis constant.
+        """
+        return text if len(text) <= max_len else text[: max_len - 3] + _ELLIPSIS
+
+    def _supports_json_response(self) -> bool:
+        """Whether the model supports forced JSON output. Cached per instance."""
+        if self._json_response_supported is None:
+            import litellm
+
+            try:
+                self._json_response_supported = bool(
+                    litellm.supports_response_schema(model=self.model)
+                )
+            except Exception:
+                # Unknown model or provider lookup failure - don't force JSON
+                self._json_response_supported = False
+        return self._json_response_supported
+
+    def _completion_kwargs(
+        self, *, schema: dict[str, Any] = _VERDICT_SCHEMA
+    ) -> dict[str, Any]:
+        """Build the keyword arguments shared by sync and async LLM calls."""
         kwargs = {**self.kwargs}
 
         # Use Azure AD token provider if configured (Entra ID auth)
         if self._azure_ad_token_provider is not None:
             kwargs["azure_ad_token_provider"] = self._azure_ad_token_provider
 
+        # Force schema-constrained output where the provider supports it;
+        # the fence-stripping and line-based parsers remain as fallbacks
+        # for providers that ignore response_format
+        if "response_format" not in kwargs and self._supports_json_response():
+            kwargs["response_format"] = schema
+
+        return kwargs
+
+    def _stream_llm(self, messages: list[dict[str, str]]) -> str:
+        """Stream the LLM response, stopping once the verdict is decoded.
+
+        Cuts decode latency when models emit long reasoning: the verdict
+        field arrives first, so remaining generation can be discarded.
+        """
+        import litellm  # deferred; heavy import paid on first call only
+
+        _ensure_pooled_session(litellm)
+        stream = litellm.completion(
+            model=self.model,
+            messages=messages,
+            api_key=self.api_key,
+            api_base=self.api_base,
+            stream=True,
+            **self._completion_kwargs(),
+        )
+        buffer = ""
+        model = response_id = created = None
+        for chunk in stream:
+            model = model or getattr(chunk, "model", None)
+            response_id = response_id or getattr(chunk, "id", None)
+            created = created or getattr(chunk, "created", None)
+            choices = getattr(chunk, "choices", None)
+            if choices:
+                buffer += choices[0].delta.content or ""
+            if _VERDICT_RE.search(buffer):
+                break
+        # Usage/cost are unavailable for abandoned streams
+        self.response = LLMResponse(
+            model=model, response_id=response_id, created=created
+        )
+        return buffer
+
+    def _call_llm(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        schema: dict[str, Any] = _VERDICT_SCHEMA,
+        stream: bool = True,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Call the LLM and return response content. Updates self.response.
+
+        `schema` is the response_format to request from schema-capable
+        providers; batch() passes the array-shaped variant since the
+        single-verdict schema would constrain an N-item reply to one
+        object. `stream=False` opts out of the fast_fail streaming path,
+        which aborts after the first decoded verdict and would truncate
+        a batch reply mid-array. `max_tokens` overrides the per-call cap
+        for replies larger than a single verdict.
+        """
+        if self.fast_fail and stream:
+            return self._stream_llm(messages)
+
+        import litellm  # deferred; heavy import paid on first call only
+
+        _ensure_pooled_session(litellm)
+        kwargs = self._completion_kwargs(schema=schema)
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
         response = litellm.completion(
             model=self.model,
             messages=messages,
@@ -167,6 +738,26 @@ class LLMAssert:
             api_base=self.api_base,
             **kwargs,
         )
+        return self._record_response(response)
+
+    async def _acall_llm(self, messages: list[dict[str, str]]) -> str:
+        """Async variant of `_call_llm` using `litellm.acompletion`."""
+        import litellm  # deferred; heavy import paid on first call only
+
+        # No session pinning here: litellm pools async clients per
+        # running event loop, and a process-global AsyncClient would
+        # break once the loop that opened its connections closes
+        response = await litellm.acompletion(
+            model=self.model,
+            messages=messages,
+            api_key=self.api_key,
+            api_base=self.api_base,
+            **self._completion_kwargs(),
+        )
+        return self._record_response(response)
+
+    def _record_response(self, response: Any) -> str:
+        """Extract content and metadata from a completion response."""
         content = response.choices[0].message.content or ""  # type: ignore[union-attr]
 
         # Store response details on instance
@@ -199,36 +790,41 @@ class LLMAssert:
         Returns:
             AssertionResult that is truthy if criterion is met
         """
-        messages = [
-            {
-                "role": "system",
-                "content": self._system_prompt,
-            },
-            {
-                "role": "user",
-                "content": f"Criterion: {criterion}\n\nContent:\n{content}",
-            },
-        ]
+        if (prefiltered := self._run_prefilters(content, criterion)) is not None:
+            return prefiltered
 
+        vector: list[float] | None = None
+        if self._cache is not None:
+            key = self._cache_key(content, criterion)
+            if (cached := self._cache.get(key)) is not None:
+                passed, reasoning = cached
+                return AssertionResult(
+                    passed=passed,
+                    criterion=criterion,
+                    reasoning=reasoning,
+                    content_preview=self._truncate(content),
+                )
+            if self.semantic_cache:
+                vector = self._embed(content, criterion)
+                if vector is not None and (
+                    near := self._cache.get_nearest(vector, self.similarity_threshold)
+                ):
+                    passed, reasoning = near
+                    return AssertionResult(
+                        passed=passed,
+                        criterion=criterion,
+                        reasoning=reasoning,
+                        content_preview=self._truncate(content),
+                    )
+
+        messages = self._build_messages(content, criterion)
         response_text = self._call_llm(messages)
+        passed, reasoning = self._parse_verdict(response_text)
 
-        # Parse JSON response
-        try:
-            # Handle potential markdown code blocks
-            text = response_text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            data = json.loads(text.strip())
-            passed = data.get("result", "").upper() == "PASS"
-            reasoning = data.get("reasoning", "")
-        except (json.JSONDecodeError, AttributeError):
-            # Fallback to line-based parsing
-            lines = response_text.strip().split("\n", 1)
-            first_line = lines[0].strip().upper()
-            passed = first_line in ("PASS", "YES", "TRUE", "PASSED")
-            reasoning = lines[1].strip() if len(lines) > 1 else response_text
+        if self._cache is not None:
+            self._cache.set(key, passed, reasoning)
+            if vector is not None:
+                self._cache.set_vector(key, vector, passed, reasoning)
 
         return AssertionResult(
             passed=passed,
@@ -236,3 +832,301 @@ class LLMAssert:
             reasoning=reasoning,
             content_preview=self._truncate(content),
         )
+
+    async def acall(self, content: str, criterion: str) -> AssertionResult:
+        """Async variant of calling the instance directly.
+
+        Use with `gather()` (or your own `asyncio.gather`) to evaluate
+        independent assertions concurrently instead of sequentially.
+
+        Args:
+            content: The text to evaluate
+            criterion: Plain English criterion (e.g., "Is this professional?")
+
+        Returns:
+            AssertionResult that is truthy if criterion is met
+        """
+        if (prefiltered := self._run_prefilters(content, criterion)) is not None:
+            return prefiltered
+
+        vector: list[float] | None = None
+        if self._cache is not None:
+            key = self._cache_key(content, criterion)
+            if (cached := self._cache.get(key)) is not None:
+                passed, reasoning = cached
+                return AssertionResult(
+                    passed=passed,
+                    criterion=criterion,
+                    reasoning=reasoning,
+                    content_preview=self._truncate(content),
+                )
+            if self.semantic_cache:
+                vector = await self._aembed(content, criterion)
+                if vector is not None and (
+                    near := self._cache.get_nearest(vector, self.similarity_threshold)
+                ):
+                    passed, reasoning = near
+                    return AssertionResult(
+                        passed=passed,
+                        criterion=criterion,
+                        reasoning=reasoning,
+                        content_preview=self._truncate(content),
+                    )
+
+        messages = self._build_messages(content, criterion)
+        response_text = await self._acall_llm(messages)
+        passed, reasoning = self._parse_verdict(response_text)
+
+        if self._cache is not None:
+            self._cache.set(key, passed, reasoning)
+            if vector is not None:
+                self._cache.set_vector(key, vector, passed, reasoning)
+
+        return AssertionResult(
+            passed=passed,
+            criterion=criterion,
+            reasoning=reasoning,
+            content_preview=self._truncate(content),
+        )
+
+    def map(self, pairs: list[tuple[str, str]]) -> list[AssertionResult]:
+        """Evaluate pairs via litellm.batch_completion, one call per pair.
+
+        Unlike `batch()`, every pair keeps its own completion (and its own
+        verdict quality), but litellm dispatches the requests concurrently.
+        Use `gather()` for the same shape over asyncio instead of threads.
+
+        Args:
+            pairs: List of (content, criterion) tuples to evaluate
+
+        Returns:
+            One AssertionResult per pair, in input order
+        """
+        if not pairs:
+            return []
+
+        import litellm  # deferred; heavy import paid on first call only
+
+        responses = litellm.batch_completion(
+            model=self.model,
+            messages=[self._build_messages(c, k) for c, k in pairs],
+            api_key=self.api_key,
+            api_base=self.api_base,
+            **self._completion_kwargs(),
+        )
+
+        results = []
+        for (content, criterion), response in zip(pairs, responses, strict=True):
+            if isinstance(response, Exception):
+                raise response
+            passed, reasoning = self._parse_verdict(self._record_response(response))
+            results.append(
+                AssertionResult(
+                    passed=passed,
+                    criterion=criterion,
+                    reasoning=reasoning,
+                    content_preview=self._truncate(content),
+                )
+            )
+        return results
+
+    def run_batch(
+        self,
+        items: list[tuple[str, str]],
+        *,
+        poll_interval: float = 5.0,
+        timeout: float = 600.0,
+    ) -> list[AssertionResult]:
+        """Evaluate pairs through the provider's batch API.
+
+        Batch endpoints (OpenAI/Azure Batch, Anthropic Message Batches)
+        trade latency for roughly half the per-token cost, so this suits
+        large offline evaluation sweeps rather than in-run assertions -
+        use `batch()`, `map()` or `gather()` for those.
+
+        Args:
+            items: List of (content, criterion) tuples to evaluate
+            poll_interval: Seconds between batch status polls
+            timeout: Seconds to wait for the batch before giving up
+
+        Returns:
+            One AssertionResult per item, in input order
+
+        Raises:
+            TimeoutError: If the batch doesn't finish within `timeout`
+            RuntimeError: If the provider reports a failed batch
+        """
+        if not items:
+            return []
+
+        import litellm  # deferred; heavy import paid on first call only
+
+        provider, _, model_name = self.model.rpartition("/")
+        provider = provider or "openai"
+        auth = {"api_key": self.api_key, "api_base": self.api_base}
+
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model_name,
+                        "messages": self._build_messages(content, criterion),
+                        **self.kwargs,
+                    },
+                }
+            )
+            for i, (content, criterion) in enumerate(items)
+        ]
+        input_file = litellm.create_file(
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+            custom_llm_provider=provider,
+            **auth,
+        )
+        batch = litellm.create_batch(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=input_file.id,
+            custom_llm_provider=provider,
+            **auth,
+        )
+
+        deadline = time.monotonic() + timeout
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Batch {batch.id} did not complete within {timeout}s"
+                )
+            time.sleep(poll_interval)
+            batch = litellm.retrieve_batch(
+                batch_id=batch.id, custom_llm_provider=provider, **auth
+            )
+        if batch.status != "completed":
+            raise RuntimeError(
+                f"Batch {batch.id} finished with status {batch.status!r}"
+            )
+
+        output = litellm.file_content(
+            file_id=batch.output_file_id, custom_llm_provider=provider, **auth
+        ).content
+        if isinstance(output, bytes):
+            output = output.decode()
+
+        # Output lines are keyed by custom_id and may arrive out of order
+        verdicts: dict[str, tuple[bool, str]] = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            body = (entry.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            text = (choices[0].get("message") or {}).get("content") if choices else ""
+            verdicts[entry.get("custom_id", "")] = self._parse_verdict(text or "")
+
+        results = []
+        for i, (content, criterion) in enumerate(items):
+            passed, reasoning = verdicts.get(
+                str(i), (False, "No output returned for this item")
+            )
+            results.append(
+                AssertionResult(
+                    passed=passed,
+                    criterion=criterion,
+                    reasoning=reasoning,
+                    content_preview=self._truncate(content),
+                )
+            )
+        return results
+
+    def gather(self, pairs: list[tuple[str, str]]) -> list[AssertionResult]:
+        """Evaluate multiple (content, criterion) pairs concurrently.
+
+        Each pair gets its own LLM call, but calls run concurrently via
+        `litellm.acompletion`, so N assertions take roughly the latency of
+        the slowest one. Concurrency is bounded by `max_concurrency`.
+
+        Args:
+            pairs: List of (content, criterion) tuples to evaluate
+
+        Returns:
+            One AssertionResult per pair, in input order
+        """
+
+        async def run() -> list[AssertionResult]:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def bounded(content: str, criterion: str) -> AssertionResult:
+                async with semaphore:
+                    return await self.acall(content, criterion)
+
+            return await asyncio.gather(*(bounded(c, k) for c, k in pairs))
+
+        return asyncio.run(run())
+
+    def batch(self, items: list[tuple[str, str]]) -> list[AssertionResult]:
+        """Evaluate multiple (content, criterion) pairs in a single LLM call.
+
+        Packing all pairs into one prompt amortizes the network round-trip
+        and prompt overhead across N criteria instead of paying it N times.
+
+        Args:
+            items: List of (content, criterion) tuples to evaluate
+
+        Returns:
+            One AssertionResult per item, in input order
+        """
+        if not items:
+            return []
+
+        sections = [
+            f"#{i}\nCriterion: {criterion}\n\nContent:\n{self._bound_content(content)}"
+            for i, (content, criterion) in enumerate(items, start=1)
+        ]
+        messages = [
+            self._batch_system_msg,
+            {
+                "role": "user",
+                "content": "\n\n---\n\n".join(sections),
+            },
+        ]
+
+        # The default 128-token cap is sized for one verdict; a batch
+        # reply grows with N, so scale it (user-supplied caps are kept)
+        max_tokens = None
+        if self._default_max_tokens:
+            max_tokens = max(
+                self.kwargs["max_tokens"], _BATCH_TOKENS_PER_ITEM * len(items)
+            )
+
+        response_text = self._call_llm(
+            messages, schema=_BATCH_SCHEMA, stream=False, max_tokens=max_tokens
+        )
+
+        entries = self._loads_json(response_text)
+        if isinstance(entries, dict):
+            # Schema-constrained replies wrap the array in an object root
+            entries = entries.get("results")
+        if not isinstance(entries, list):
+            entries = []
+
+        results = []
+        for i, (content, criterion) in enumerate(items):
+            entry = entries[i] if i < len(entries) else {}
+            if isinstance(entry, dict):
+                passed = entry.get("result", "").upper() == "PASS"
+                reasoning = entry.get("reasoning", "")
+            else:
+                passed = False
+                reasoning = f"Unparseable batch entry: {entry!r}"
+            results.append(
+                AssertionResult(
+                    passed=passed,
+                    criterion=criterion,
+                    reasoning=reasoning,
+                    content_preview=self._truncate(content),
+                )
+            )
+        return results
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from pytest_llm_assert.core import LLMAssert
@@ -25,19 +27,33 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=None,
         help="Custom API base URL for LLM provider",
     )
+    group.addoption(
+        "--llm-cache",
+        action="store_true",
+        default=False,
+        help="Cache assertion results on disk under .pytest_cache/llm_assert/",
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llm_assert(request: pytest.FixtureRequest) -> LLMAssert:
     """Fixture providing an LLMAssert instance configured via CLI options.
 
+    Session-scoped: CLI options are constant for a run, and LLMAssert is
+    safe to share - construction costs (env reads, Azure credential
+    discovery) are paid once, and `.response` is context-local per call.
+
     Example:
         def test_greeting(llm_assert):
             response = "Hello! How can I help you today?"
             assert llm_assert(response, "Is this a friendly greeting?")
     """
+    cache: bool | Path = False
+    if request.config.getoption("--llm-cache") and request.config.cache is not None:
+        cache = request.config.cache.mkdir("llm_assert")
     return LLMAssert(
         model=request.config.getoption("--llm-model"),
         api_key=request.config.getoption("--llm-api-key"),
         api_base=request.config.getoption("--llm-api-base"),
+        cache=cache,
     )
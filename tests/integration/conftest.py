@@ -0,0 +1,31 @@
+"""Integration test configuration.
+
+Supports parallel runs with pytest-xdist:
+
+    pytest -m integration -n 8 --dist=loadgroup
+
+Tests are grouped by LLM provider so each worker keeps one provider's
+credentials and TCP connections warm, while different providers run in
+parallel.
+"""
+
+import pytest
+
+# Fixture params that identify a provider (see the `llm` fixture)
+_PROVIDERS = ("azure", "vertex")
+
+
+def pytest_configure(config):
+    """Register the xdist_group marker for runs without pytest-xdist."""
+    config.addinivalue_line(
+        "markers", "xdist_group(name): group tests onto one xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Group provider-parametrized tests onto the same xdist worker."""
+    for item in items:
+        params = getattr(item, "callspec", None)
+        provider = params.params.get("llm") if params else None
+        if provider in _PROVIDERS:
+            item.add_marker(pytest.mark.xdist_group(name=provider))
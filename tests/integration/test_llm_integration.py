@@ -9,24 +9,17 @@ Run with: pytest -m integration -v
 from __future__ import annotations
 
 import os
-from pathlib import Path
-import pytest
-
-
-# Load .env from workspace root (search upward)
-def _find_env_file() -> Path | None:
-    path = Path(__file__).resolve()
-    for parent in path.parents:
-        env_file = parent / ".env"
-        if env_file.exists():
-            return env_file
-    return None
 
+import pytest
 
-if env_file := _find_env_file():
-    from dotenv import load_dotenv
+# Skip the whole file (instead of erroring) when the dev extras or the
+# LLM stack are absent, e.g. in a minimal CI job running -m "not integration"
+dotenv = pytest.importorskip("dotenv")
+pytest.importorskip("litellm")
 
-    load_dotenv(env_file)
+# Load .env from the workspace root (dotenv searches upward once per
+# process and no-ops when no file exists)
+dotenv.load_dotenv()
 
 pytestmark = pytest.mark.integration
 
@@ -47,7 +40,7 @@ VERTEX_MODEL = os.environ.get("VERTEX_MODEL", "gemini-2.0-flash")
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def azure_llm_factory():
     """Factory to create LLMAssert for Azure OpenAI.
 
@@ -57,7 +50,9 @@ def azure_llm_factory():
     """
     from pytest_llm_assert import LLMAssert
 
-    endpoint = os.environ["AZURE_OPENAI_ENDPOINT"]  # Fail if not set
+    endpoint = os.environ.get("AZURE_OPENAI_ENDPOINT")
+    if not endpoint:
+        pytest.skip("AZURE_OPENAI_ENDPOINT not set")
 
     def create(deployment: str) -> LLMAssert:
         # Entra ID auth is automatic when no api_key is provided
@@ -69,7 +64,7 @@ def azure_llm_factory():
     return create
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def vertex_llm_factory():
     """Factory to create LLMAssert for Google Vertex AI.
 
@@ -95,12 +90,16 @@ def vertex_llm_factory():
 
 # Combined fixture for running same tests across providers
 @pytest.fixture(params=["azure", "vertex"])
-def llm(request, azure_llm_factory, vertex_llm_factory):
-    """LLM instance that cycles through available providers."""
+def llm(request):
+    """LLM instance that cycles through available providers.
+
+    Factories are resolved lazily so a missing provider only skips its
+    own parametrization instead of every provider's.
+    """
     if request.param == "azure":
-        return azure_llm_factory(AZURE_DEPLOYMENT)
+        return request.getfixturevalue("azure_llm_factory")(AZURE_DEPLOYMENT)
     elif request.param == "vertex":
-        return vertex_llm_factory(VERTEX_MODEL)
+        return request.getfixturevalue("vertex_llm_factory")(VERTEX_MODEL)
     else:
         msg = f"Unknown provider: {request.param}"
         raise ValueError(msg)
@@ -133,7 +132,11 @@ class TestSemanticVariations:
     """
 
     def test_success_message_variations(self, llm):
-        """Different ways to indicate success should all pass."""
+        """Different ways to indicate success should all pass.
+
+        Dispatched concurrently via gather() so the test takes roughly
+        one round-trip instead of six.
+        """
         success_messages = [
             "Operation completed successfully",
             "Done. 5 items processed.",
@@ -142,8 +145,9 @@ class TestSemanticVariations:
             "Request fulfilled",
             "Task finished without errors",
         ]
-        for msg in success_messages:
-            result = llm(msg, "Does this indicate the operation succeeded?")
+        criterion = "Does this indicate the operation succeeded?"
+        results = llm.gather([(msg, criterion) for msg in success_messages])
+        for msg, result in zip(success_messages, results, strict=True):
             assert result, f"Failed to recognize success: {msg}"
 
     def test_error_message_variations(self, llm):
@@ -159,11 +163,9 @@ class TestSemanticVariations:
             "Unable to process request",
             "FATAL: Out of memory",
         ]
-        passed_count = 0
-        for msg in error_messages:
-            result = llm(msg, "Does this indicate an error or failure?")
-            if result:
-                passed_count += 1
+        criterion = "Does this indicate an error or failure?"
+        results = llm.gather([(msg, criterion) for msg in error_messages])
+        passed_count = sum(bool(result) for result in results)
 
         # Allow 1 flaky failure - LLMs can be inconsistent
         min_required = len(error_messages) - 1
@@ -185,11 +187,9 @@ class TestSQLSemanticEquivalence:
             "SELECT u.name FROM users u WHERE u.age > 21",  # With alias
             "SELECT name FROM users WHERE age > 21 ORDER BY name",  # With ORDER BY
         ]
-        for sql in valid_queries:
-            result = llm(
-                sql,
-                "Is this a valid SQL query that selects user names filtered by age?",
-            )
+        criterion = "Is this a valid SQL query that selects user names filtered by age?"
+        results = llm.gather([(sql, criterion) for sql in valid_queries])
+        for sql, result in zip(valid_queries, results, strict=True):
             assert result, f"Failed to validate: {sql}"
 
     def test_invalid_sql_detected(self, llm):
@@ -199,8 +199,9 @@ class TestSQLSemanticEquivalence:
             "SELECT name WHERE age > 21",  # Missing FROM
             "DELETE FROM users",  # Wrong operation
         ]
-        for sql in invalid_queries:
-            result = llm(sql, "Is this a valid SELECT query for user names?")
+        criterion = "Is this a valid SELECT query for user names?"
+        results = llm.gather([(sql, criterion) for sql in invalid_queries])
+        for sql, result in zip(invalid_queries, results, strict=True):
             assert not result, f"Should have rejected: {sql}"
 
 
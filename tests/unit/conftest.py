@@ -0,0 +1,103 @@
+"""Shared helpers for unit tests."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from pytest_llm_assert import core
+from pytest_llm_assert.core import LLMAssert
+
+
+@pytest.fixture(autouse=True)
+def _clear_env_expansion_cache() -> Any:
+    """Keep memoized ${VAR} expansion from leaking across env patches."""
+    core._expand_env_template.cache_clear()
+    yield
+    core._expand_env_template.cache_clear()
+
+
+def fake_response(
+    content: str | None,
+    *,
+    model: str | None = None,
+    response_id: str | None = None,
+    created: int | None = None,
+    usage: dict[str, int] | None = None,
+    cost: float | None = None,
+) -> SimpleNamespace:
+    """Minimal stand-in for a litellm completion response.
+
+    SimpleNamespace constructs ~50x faster than a MagicMock chain and
+    has no attribute auto-vivification, so tests only see what they set.
+    Metadata is optional; `_hidden_params` only exists when a cost is
+    given, keeping the attribute-absent code path testable.
+    """
+    message = SimpleNamespace(content=content)
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=message)],
+        model=model,
+        id=response_id,
+        created=created,
+        usage=SimpleNamespace(**usage) if usage is not None else None,
+    )
+    if cost is not None:
+        response._hidden_params = {"response_cost": cost}
+    return response
+
+
+@pytest.fixture
+def fake_llm_response() -> Any:
+    """Factory fixture building fake completion responses."""
+    return fake_response
+
+
+@pytest.fixture(scope="session")
+def llm() -> LLMAssert:
+    """One warm shared instance for tests that don't need custom config.
+
+    Construction is exercised by the initialization tests; everything
+    else can reuse a single instance.
+    """
+    return LLMAssert(model="test/model")
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_llm(request: pytest.FixtureRequest) -> Any:
+    """Clear per-call state on the shared instance between tests."""
+    yield
+    if "llm" in request.fixturenames:
+        request.getfixturevalue("llm").response = None
+
+
+@pytest.fixture(scope="module")
+def _completion_stub() -> Any:
+    """Install one litellm.completion stub per test module.
+
+    Patching once per module (instead of per test via @patch) avoids
+    repeated install/uninstall and MagicMock construction on the unit
+    suite's hottest path.
+    """
+    import litellm
+
+    def _stub(**kwargs: Any) -> Any:
+        _stub.calls.append(kwargs)
+        return _stub.next_response
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(litellm, "completion", _stub)
+        yield _stub
+
+
+@pytest.fixture
+def mock_completion(_completion_stub: Any) -> Any:
+    """Per-test view of the module-scoped completion stub.
+
+    Tests set `mock_completion.next_response = fake_response(...)` and
+    inspect keyword arguments via `mock_completion.calls`.
+    """
+    _completion_stub.calls = []
+    _completion_stub.next_response = None
+    return _completion_stub
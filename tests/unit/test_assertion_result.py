@@ -1,5 +1,9 @@
 """Tests for AssertionResult dataclass."""
 
+import dataclasses
+
+import pytest
+
 from pytest_llm_assert.core import AssertionResult
 
 
@@ -27,6 +31,29 @@ class TestBooleanBehavior:
         assert bool(result) is False
 
 
+class TestImmutability:
+    """Results are frozen once evaluated."""
+
+    def test_fields_cannot_be_reassigned(self) -> None:
+        result = AssertionResult(
+            passed=True,
+            criterion="Is greeting",
+            reasoning="Contains hello",
+            content_preview="Hello...",
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.passed = False
+
+    def test_hashable(self) -> None:
+        result = AssertionResult(
+            passed=True,
+            criterion="Is greeting",
+            reasoning="Contains hello",
+            content_preview="Hello...",
+        )
+        assert result in {result}
+
+
 class TestRepr:
     """AssertionResult repr should be informative for pytest output."""
 
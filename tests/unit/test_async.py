@@ -0,0 +1,109 @@
+"""Tests for async assertion dispatch via litellm.acompletion."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from pytest_llm_assert.core import LLMAssert
+from tests.unit.conftest import fake_response
+
+
+class TestAcall:
+    """Single async assertion calls."""
+
+    @patch("pytest_llm_assert.core.litellm.acompletion", new_callable=AsyncMock)
+    def test_pass_result(self, mock_acompletion: AsyncMock) -> None:
+        mock_acompletion.return_value = fake_response(
+            '{"result": "PASS", "reasoning": "Is a greeting"}'
+        )
+
+        llm = LLMAssert(model="test/model")
+        result = asyncio.run(llm.acall("Hello", "Is this a greeting?"))
+
+        assert result.passed is True
+        assert result.criterion == "Is this a greeting?"
+        assert result.reasoning == "Is a greeting"
+
+    @patch("pytest_llm_assert.core.litellm.acompletion", new_callable=AsyncMock)
+    def test_fail_result(self, mock_acompletion: AsyncMock) -> None:
+        mock_acompletion.return_value = fake_response(
+            '{"result": "FAIL", "reasoning": "Not a greeting"}'
+        )
+
+        llm = LLMAssert(model="test/model")
+        result = asyncio.run(llm.acall("Goodbye", "Is this a greeting?"))
+
+        assert result.passed is False
+
+    @patch("pytest_llm_assert.core.litellm.acompletion", new_callable=AsyncMock)
+    def test_kwargs_passed_to_litellm(self, mock_acompletion: AsyncMock) -> None:
+        mock_acompletion.return_value = fake_response("PASS")
+
+        llm = LLMAssert(model="test/model", temperature=0)
+        asyncio.run(llm.acall("content", "criterion"))
+
+        assert mock_acompletion.call_args.kwargs.get("temperature") == 0
+
+
+class TestGather:
+    """Concurrent evaluation of independent pairs."""
+
+    @patch("pytest_llm_assert.core.litellm.acompletion", new_callable=AsyncMock)
+    def test_one_call_per_pair(self, mock_acompletion: AsyncMock) -> None:
+        mock_acompletion.return_value = fake_response(
+            '{"result": "PASS", "reasoning": "OK"}'
+        )
+
+        llm = LLMAssert(model="test/model")
+        results = llm.gather([("A", "crit"), ("B", "crit"), ("C", "crit")])
+
+        assert mock_acompletion.call_count == 3
+        assert len(results) == 3
+        assert all(results)
+
+    @patch("pytest_llm_assert.core.litellm.acompletion", new_callable=AsyncMock)
+    def test_results_preserve_order(self, mock_acompletion: AsyncMock) -> None:
+        mock_acompletion.return_value = fake_response(
+            '{"result": "PASS", "reasoning": "OK"}'
+        )
+
+        llm = LLMAssert(model="test/model")
+        results = llm.gather([("first", "crit one"), ("second", "crit two")])
+
+        assert results[0].criterion == "crit one"
+        assert results[0].content_preview == "first"
+        assert results[1].criterion == "crit two"
+
+    def test_empty_pairs(self) -> None:
+        llm = LLMAssert(model="test/model")
+        assert llm.gather([]) == []
+
+    def test_max_concurrency_stored(self) -> None:
+        llm = LLMAssert(model="test/model", max_concurrency=2)
+        assert llm.max_concurrency == 2
+
+
+class TestResponseIsolation:
+    """Concurrent tasks see their own last response, not each other's."""
+
+    @patch("pytest_llm_assert.core.litellm.acompletion", new_callable=AsyncMock)
+    def test_each_task_sees_own_response(self, mock_acompletion: AsyncMock) -> None:
+        verdict = '{"result": "PASS", "reasoning": "OK"}'
+        mock_acompletion.side_effect = [
+            fake_response(verdict, response_id="call-1"),
+            fake_response(verdict, response_id="call-2"),
+        ]
+
+        llm = LLMAssert(model="test/model")
+        seen = {}
+
+        async def check(name: str, content: str) -> None:
+            await llm.acall(content, "criterion")
+            await asyncio.sleep(0)  # let the other task overwrite if shared
+            seen[name] = llm.response.response_id
+
+        async def run() -> None:
+            await asyncio.gather(check("a", "first"), check("b", "second"))
+
+        asyncio.run(run())
+
+        assert sorted(seen.values()) == ["call-1", "call-2"]
@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock, patch
 
 from pytest_llm_assert.core import LLMAssert
+from tests.unit.conftest import fake_response
 
 
 class TestAzureModelDetection:
@@ -58,10 +59,9 @@ class TestAzureAdTokenProvider:
                 llm = LLMAssert.__new__(LLMAssert)
                 llm.model = "azure/gpt-4o"
                 llm.api_key = None
+                llm._has_azure_key = False
                 llm.api_base = None
                 llm.kwargs = {}
-                llm._system_prompt = "test"
-                llm.response = None
                 llm._azure_ad_token_provider = None
 
                 # Manually trigger the check
@@ -111,6 +111,27 @@ class TestAzureAdTokenProvider:
         _get_azure_ad_token_provider.cache_clear()
 
 
+class TestTokenProviderMemoization:
+    """Token provider construction is shared across LLMAssert instances."""
+
+    def test_provider_constructed_once_across_instances(self) -> None:
+        from pytest_llm_assert.core import _get_azure_ad_token_provider
+
+        _get_azure_ad_token_provider.cache_clear()
+        with patch(
+            "litellm.secret_managers.get_azure_ad_token_provider.get_azure_ad_token_provider",
+            return_value=lambda: "token",
+        ) as mock_factory:
+            with patch.dict("os.environ", {}, clear=True):
+                LLMAssert(model="azure/gpt-4o")
+                LLMAssert(model="azure/gpt-4o")
+                LLMAssert(model="azure/gpt-5-mini")
+
+            # DefaultAzureCredential chain built only once per process
+            assert mock_factory.call_count == 1
+        _get_azure_ad_token_provider.cache_clear()
+
+
 class TestAzureInitialization:
     """Azure model initialization with Entra ID."""
 
@@ -157,10 +178,7 @@ class TestAzureTokenProviderInCall:
     @patch("pytest_llm_assert.core.litellm.completion")
     def test_token_provider_passed_to_litellm(self, mock_completion: MagicMock) -> None:
         """When token provider is set, it should be passed to litellm."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "PASS"
-        mock_completion.return_value = mock_response
+        mock_completion.return_value = fake_response("PASS")
 
         # Create LLM and manually set token provider
         llm = LLMAssert(model="azure/gpt-4o", api_base="https://test.openai.azure.com")
@@ -0,0 +1,222 @@
+"""Tests for batched LLM assertions."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pytest_llm_assert.core import LLMAssert
+from tests.unit.conftest import fake_response
+
+
+class TestBatch:
+    """Batch evaluation of multiple (content, criterion) pairs."""
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_single_llm_call_for_all_items(self, mock_completion: MagicMock) -> None:
+        """All items should be evaluated in one completion call."""
+        mock_completion.return_value = fake_response(
+            json.dumps(
+                [
+                    {"result": "PASS", "reasoning": "Greeting"},
+                    {"result": "PASS", "reasoning": "Also greeting"},
+                ]
+            )
+        )
+
+        llm = LLMAssert(model="test/model")
+        results = llm.batch(
+            [("Hello", "Is this a greeting?"), ("Hi there", "Is this a greeting?")]
+        )
+
+        assert mock_completion.call_count == 1
+        assert len(results) == 2
+        assert all(results)
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_results_preserve_order(self, mock_completion: MagicMock) -> None:
+        mock_completion.return_value = fake_response(
+            json.dumps(
+                [
+                    {"result": "PASS", "reasoning": "First"},
+                    {"result": "FAIL", "reasoning": "Second"},
+                ]
+            )
+        )
+
+        llm = LLMAssert(model="test/model")
+        results = llm.batch([("A", "crit A"), ("B", "crit B")])
+
+        assert results[0].passed is True
+        assert results[0].criterion == "crit A"
+        assert results[0].reasoning == "First"
+        assert results[1].passed is False
+        assert results[1].criterion == "crit B"
+        assert results[1].reasoning == "Second"
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_markdown_wrapped_array(self, mock_completion: MagicMock) -> None:
+        """Batch responses wrapped in markdown code blocks should parse."""
+        mock_completion.return_value = fake_response(
+            '```json\n[{"result": "PASS", "reasoning": "OK"}]\n```'
+        )
+
+        llm = LLMAssert(model="test/model")
+        results = llm.batch([("content", "criterion")])
+
+        assert results[0].passed is True
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_items_enumerated_in_prompt(self, mock_completion: MagicMock) -> None:
+        """Each item should appear numbered in the user message."""
+        mock_completion.return_value = fake_response("[]")
+
+        llm = LLMAssert(model="test/model")
+        llm.batch([("first content", "crit one"), ("second content", "crit two")])
+
+        messages = mock_completion.call_args.kwargs["messages"]
+        user_msg = messages[1]["content"]
+        assert "#1" in user_msg
+        assert "#2" in user_msg
+        assert "first content" in user_msg
+        assert "crit two" in user_msg
+
+    @patch("pytest_llm_assert.core.litellm.supports_response_schema")
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_schema_constrained_batch(
+        self, mock_completion: MagicMock, mock_supports: MagicMock
+    ) -> None:
+        """Schema-capable models get an array schema and an object reply."""
+        mock_supports.return_value = True
+        mock_completion.return_value = fake_response(
+            json.dumps(
+                {
+                    "results": [
+                        {"result": "PASS", "reasoning": "First"},
+                        {"result": "FAIL", "reasoning": "Second"},
+                    ]
+                }
+            )
+        )
+
+        llm = LLMAssert(model="test/model")
+        results = llm.batch([("A", "crit A"), ("B", "crit B")])
+
+        sent = mock_completion.call_args.kwargs["response_format"]
+        schema = sent["json_schema"]["schema"]
+        assert schema["properties"]["results"]["type"] == "array"
+        assert results[0].passed is True
+        assert results[1].passed is False
+        assert results[1].reasoning == "Second"
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_missing_entries_fail(self, mock_completion: MagicMock) -> None:
+        """Items without a corresponding response entry should fail."""
+        mock_completion.return_value = fake_response(
+            json.dumps([{"result": "PASS", "reasoning": "Only one"}])
+        )
+
+        llm = LLMAssert(model="test/model")
+        results = llm.batch([("A", "crit"), ("B", "crit")])
+
+        assert results[0].passed is True
+        assert results[1].passed is False
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_fast_fail_reads_full_response(self, mock_completion: MagicMock) -> None:
+        """fast_fail streaming stops at the first verdict; batch must not."""
+        mock_completion.return_value = fake_response(
+            json.dumps(
+                [
+                    {"result": "PASS", "reasoning": "First"},
+                    {"result": "FAIL", "reasoning": "Second"},
+                ]
+            )
+        )
+
+        llm = LLMAssert(model="test/model", fast_fail=True)
+        results = llm.batch([("A", "crit A"), ("B", "crit B")])
+
+        assert "stream" not in mock_completion.call_args.kwargs
+        assert results[0].passed is True
+        assert results[1].passed is False
+        assert results[1].reasoning == "Second"
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_max_tokens_scales_with_items(self, mock_completion: MagicMock) -> None:
+        """The single-verdict token cap must not truncate larger batches."""
+        mock_completion.return_value = fake_response("[]")
+
+        llm = LLMAssert(model="test/model")
+        llm.batch([("content", "crit")] * 8)
+
+        assert mock_completion.call_args.kwargs["max_tokens"] == 8 * 48
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_user_max_tokens_respected(self, mock_completion: MagicMock) -> None:
+        mock_completion.return_value = fake_response("[]")
+
+        llm = LLMAssert(model="test/model", max_tokens=100)
+        llm.batch([("content", "crit")] * 8)
+
+        assert mock_completion.call_args.kwargs["max_tokens"] == 100
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_unparseable_response_fails_all(self, mock_completion: MagicMock) -> None:
+        mock_completion.return_value = fake_response("not json at all")
+
+        llm = LLMAssert(model="test/model")
+        results = llm.batch([("A", "crit"), ("B", "crit")])
+
+        assert len(results) == 2
+        assert not any(results)
+
+    def test_empty_items_no_call(self) -> None:
+        """Empty input should return without calling the LLM."""
+        with patch("pytest_llm_assert.core.litellm.completion") as mock_completion:
+            llm = LLMAssert(model="test/model")
+            assert llm.batch([]) == []
+            mock_completion.assert_not_called()
+
+
+class TestMap:
+    """Concurrent per-pair dispatch via litellm.batch_completion."""
+
+    @patch("pytest_llm_assert.core.litellm.batch_completion")
+    def test_one_batch_call_with_all_messages(
+        self, mock_batch_completion: MagicMock
+    ) -> None:
+        mock_batch_completion.return_value = [
+            fake_response('{"result": "PASS", "reasoning": "First"}'),
+            fake_response('{"result": "FAIL", "reasoning": "Second"}'),
+        ]
+
+        llm = LLMAssert(model="test/model")
+        results = llm.map([("A", "crit A"), ("B", "crit B")])
+
+        assert mock_batch_completion.call_count == 1
+        messages = mock_batch_completion.call_args.kwargs["messages"]
+        assert len(messages) == 2
+        assert results[0].passed is True
+        assert results[0].criterion == "crit A"
+        assert results[1].passed is False
+        assert results[1].reasoning == "Second"
+
+    @patch("pytest_llm_assert.core.litellm.batch_completion")
+    def test_per_pair_exception_propagates(
+        self, mock_batch_completion: MagicMock
+    ) -> None:
+        mock_batch_completion.return_value = [
+            fake_response('{"result": "PASS", "reasoning": "OK"}'),
+            ConnectionError("Failed to connect"),
+        ]
+
+        llm = LLMAssert(model="test/model")
+        with pytest.raises(ConnectionError, match="Failed to connect"):
+            llm.map([("A", "crit"), ("B", "crit")])
+
+    def test_empty_pairs_no_call(self) -> None:
+        with patch("pytest_llm_assert.core.litellm.batch_completion") as mock_batch:
+            llm = LLMAssert(model="test/model")
+            assert llm.map([]) == []
+            mock_batch.assert_not_called()
@@ -0,0 +1,209 @@
+"""Tests for on-disk assertion result caching."""
+
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pytest_llm_assert.core import LLMAssert, _ResultCache
+from tests.unit.conftest import fake_response
+
+
+class TestCacheKey:
+    """Cache key generation."""
+
+    def test_same_inputs_same_key(self) -> None:
+        llm = LLMAssert(model="test/model")
+        assert llm._cache_key("content", "criterion") == llm._cache_key(
+            "content", "criterion"
+        )
+
+    def test_different_content_different_key(self) -> None:
+        llm = LLMAssert(model="test/model")
+        assert llm._cache_key("a", "criterion") != llm._cache_key("b", "criterion")
+
+    def test_model_change_invalidates(self) -> None:
+        llm_a = LLMAssert(model="test/model-a")
+        llm_b = LLMAssert(model="test/model-b")
+        assert llm_a._cache_key("content", "crit") != llm_b._cache_key(
+            "content", "crit"
+        )
+
+    def test_system_prompt_change_invalidates(self) -> None:
+        llm_a = LLMAssert(model="test/model")
+        llm_b = LLMAssert(model="test/model")
+        llm_b.system_prompt = "Different prompt"
+        assert llm_a._cache_key("content", "crit") != llm_b._cache_key(
+            "content", "crit"
+        )
+
+
+class TestResultCache:
+    """SQLite cache storage."""
+
+    def test_miss_returns_none(self, tmp_path: Path) -> None:
+        cache = _ResultCache(tmp_path)
+        assert cache.get("missing") is None
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        cache = _ResultCache(tmp_path)
+        cache.set("key1", True, "Looks good")
+        assert cache.get("key1") == (True, "Looks good")
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        _ResultCache(tmp_path).set("key1", False, "Nope")
+        assert _ResultCache(tmp_path).get("key1") == (False, "Nope")
+
+    def test_expired_entry_is_miss(self, tmp_path: Path) -> None:
+        cache = _ResultCache(tmp_path, ttl=60)
+        cache.set("key1", True, "Fresh")
+        with patch("pytest_llm_assert.core.time.time", return_value=time.time() + 120):
+            assert cache.get("key1") is None
+
+    def test_fresh_entry_within_ttl(self, tmp_path: Path) -> None:
+        cache = _ResultCache(tmp_path, ttl=3600)
+        cache.set("key1", True, "Fresh")
+        assert cache.get("key1") == (True, "Fresh")
+
+
+class TestCachedCalls:
+    """Cache integration in __call__."""
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_disabled_by_default(self, mock_completion: MagicMock) -> None:
+        mock_completion.return_value = fake_response("PASS")
+
+        llm = LLMAssert(model="test/model")
+        llm("content", "criterion")
+        llm("content", "criterion")
+
+        assert mock_completion.call_count == 2
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_hit_skips_llm(self, mock_completion: MagicMock, tmp_path: Path) -> None:
+        mock_completion.return_value = fake_response(
+            '{"result": "PASS", "reasoning": "Cached"}'
+        )
+
+        llm = LLMAssert(model="test/model", cache=tmp_path)
+        first = llm("content", "criterion")
+        second = llm("content", "criterion")
+
+        assert mock_completion.call_count == 1
+        assert second.passed is first.passed
+        assert second.reasoning == "Cached"
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_survives_rerun(self, mock_completion: MagicMock, tmp_path: Path) -> None:
+        """A fresh instance pointed at the same directory reuses results."""
+        mock_completion.return_value = fake_response(
+            '{"result": "FAIL", "reasoning": "Stored"}'
+        )
+
+        LLMAssert(model="test/model", cache=tmp_path)("content", "criterion")
+        result = LLMAssert(model="test/model", cache=tmp_path)("content", "criterion")
+
+        assert mock_completion.call_count == 1
+        assert result.passed is False
+        assert result.reasoning == "Stored"
+
+
+def _fake_embedding(vector: list[float]) -> MagicMock:
+    response = MagicMock()
+    response.data = [{"embedding": vector}]
+    return response
+
+
+class TestSemanticCache:
+    """Embedding-based reuse of verdicts for near-identical pairs."""
+
+    def test_nearest_vector_roundtrip(self, tmp_path: Path) -> None:
+        cache = _ResultCache(tmp_path)
+        cache.set_vector("k1", [1.0, 0.0], True, "Stored")
+
+        assert cache.get_nearest([1.0, 0.0], threshold=0.95) == (True, "Stored")
+        assert cache.get_nearest([0.0, 1.0], threshold=0.95) is None
+
+    def test_dimension_mismatch_is_miss(self, tmp_path: Path) -> None:
+        """Switching embedding models must not return garbage scores."""
+        cache = _ResultCache(tmp_path)
+        cache.set_vector("k1", [1.0, 0.0], True, "Stored")
+
+        assert cache.get_nearest([1.0, 0.0, 0.0], threshold=0.5) is None
+
+    @patch("pytest_llm_assert.core.litellm.embedding")
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_similar_pair_skips_llm(
+        self, mock_completion: MagicMock, mock_embedding: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_completion.return_value = fake_response(
+            '{"result": "PASS", "reasoning": "Succeeded"}'
+        )
+        # Two nearly parallel unit vectors: cosine ~0.9998
+        mock_embedding.side_effect = [
+            _fake_embedding([1.0, 0.0, 0.0]),
+            _fake_embedding([0.9999, 0.0141, 0.0]),
+        ]
+
+        llm = LLMAssert(model="test/model", cache=tmp_path, semantic_cache=True)
+        llm("Operation completed successfully", "Did it succeed?")
+        result = llm("The operation was a success", "Did it succeed?")
+
+        assert mock_completion.call_count == 1
+        assert result.passed is True
+        assert result.reasoning == "Succeeded"
+
+    @patch("pytest_llm_assert.core.litellm.aembedding", new_callable=AsyncMock)
+    @patch("pytest_llm_assert.core.litellm.acompletion", new_callable=AsyncMock)
+    def test_gather_uses_semantic_cache(
+        self, mock_acompletion: AsyncMock, mock_aembedding: AsyncMock, tmp_path: Path
+    ) -> None:
+        """acall/gather consult and populate the vector table too."""
+        mock_acompletion.return_value = fake_response(
+            '{"result": "PASS", "reasoning": "Succeeded"}'
+        )
+        mock_aembedding.side_effect = [
+            _fake_embedding([1.0, 0.0, 0.0]),
+            _fake_embedding([0.9999, 0.0141, 0.0]),
+        ]
+
+        llm = LLMAssert(model="test/model", cache=tmp_path, semantic_cache=True)
+        llm.gather([("Operation completed successfully", "Did it succeed?")])
+        results = llm.gather([("The operation was a success", "Did it succeed?")])
+
+        assert mock_acompletion.call_count == 1
+        assert results[0].passed is True
+        assert results[0].reasoning == "Succeeded"
+
+    @patch("pytest_llm_assert.core.litellm.embedding")
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_dissimilar_pair_calls_llm(
+        self, mock_completion: MagicMock, mock_embedding: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_completion.return_value = fake_response(
+            '{"result": "PASS", "reasoning": "OK"}'
+        )
+        mock_embedding.side_effect = [
+            _fake_embedding([1.0, 0.0]),
+            _fake_embedding([0.0, 1.0]),
+        ]
+
+        llm = LLMAssert(model="test/model", cache=tmp_path, semantic_cache=True)
+        llm("content one", "criterion")
+        llm("something else entirely", "criterion")
+
+        assert mock_completion.call_count == 2
+
+    @patch("pytest_llm_assert.core.litellm.embedding")
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_embedding_failure_falls_back(
+        self, mock_completion: MagicMock, mock_embedding: MagicMock, tmp_path: Path
+    ) -> None:
+        """Embedding errors must not break assertions."""
+        mock_completion.return_value = fake_response("PASS")
+        mock_embedding.side_effect = RuntimeError("embedding service down")
+
+        llm = LLMAssert(model="test/model", cache=tmp_path, semantic_cache=True)
+        result = llm("content", "criterion")
+
+        assert result.passed is True
+        assert mock_completion.call_count == 1
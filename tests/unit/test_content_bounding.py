@@ -0,0 +1,62 @@
+"""Tests for token-budget content trimming."""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from pytest_llm_assert.core import LLMAssert
+from tests.unit.conftest import fake_response
+
+
+class TestBoundContent:
+    """Content trimming against max_content_tokens."""
+
+    def test_short_content_unchanged(self) -> None:
+        llm = LLMAssert(model="test/model")
+        assert llm._bound_content("short content") == "short content"
+
+    def test_disabled_with_none(self) -> None:
+        llm = LLMAssert(model="test/model", max_content_tokens=None)
+        content = "X" * 100_000
+        assert llm._bound_content(content) is content
+
+    @patch("pytest_llm_assert.core.litellm.token_counter")
+    def test_under_budget_unchanged(self, mock_counter: MagicMock) -> None:
+        """Long in characters but within the token budget stays untouched."""
+        mock_counter.return_value = 50
+        llm = LLMAssert(model="test/model", max_content_tokens=100)
+
+        content = "word " * 50  # 250 chars, 50 tokens
+        assert llm._bound_content(content) == content
+
+    @patch("pytest_llm_assert.core.litellm.token_counter")
+    def test_over_budget_trimmed(self, mock_counter: MagicMock) -> None:
+        mock_counter.return_value = 1000
+        llm = LLMAssert(model="test/model", max_content_tokens=100)
+
+        content = "A" * 4000
+        bounded = llm._bound_content(content)
+
+        assert len(bounded) < len(content)
+        assert "...[content truncated]..." in bounded
+        assert bounded.startswith("A")
+        assert bounded.endswith("A")
+
+    @patch("pytest_llm_assert.core.litellm.token_counter")
+    def test_skips_counting_when_obviously_short(self, mock_counter: MagicMock) -> None:
+        """A token is at least one char, so short strings skip counting."""
+        llm = LLMAssert(model="test/model", max_content_tokens=4096)
+        llm._bound_content("short")
+        mock_counter.assert_not_called()
+
+    @patch("pytest_llm_assert.core.litellm.token_counter")
+    def test_trimmed_content_sent_to_llm(
+        self, mock_counter: MagicMock, mock_completion: Any
+    ) -> None:
+        mock_counter.return_value = 1000
+        mock_completion.next_response = fake_response("PASS")
+
+        llm = LLMAssert(model="test/model", max_content_tokens=100)
+        llm("B" * 4000, "criterion")
+
+        user_msg = mock_completion.calls[-1]["messages"][1]["content"]
+        assert "...[content truncated]..." in user_msg
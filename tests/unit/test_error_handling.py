@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from pytest_llm_assert.core import LLMAssert
+from tests.unit.conftest import fake_response
 
 
 class TestAPIErrors:
@@ -43,10 +44,7 @@ class TestMalformedResponses:
 
     @patch("pytest_llm_assert.core.litellm.completion")
     def test_invalid_format_is_fail(self, mock_completion: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "@@#$%INVALID"
-        mock_completion.return_value = mock_response
+        mock_completion.return_value = fake_response("@@#$%INVALID")
 
         llm = LLMAssert(model="test/model")
         result = llm("Content", "criterion")
@@ -0,0 +1,51 @@
+"""Tests for pooled httpx sessions installed on litellm."""
+
+from __future__ import annotations
+
+import httpx
+
+from pytest_llm_assert.core import _ensure_pooled_session
+
+
+class _FakeLitellm:
+    client_session = None
+    aclient_session = None
+
+
+class TestPooledSession:
+    """Connection pooling via litellm's session hooks."""
+
+    def test_installs_sync_client(self) -> None:
+        fake = _FakeLitellm()
+        _ensure_pooled_session(fake)
+
+        assert isinstance(fake.client_session, httpx.Client)
+
+    def test_async_session_left_alone(self) -> None:
+        """A global AsyncClient would outlive gather()'s per-call event
+        loops and fail once its loop closes; litellm's own per-loop
+        client cache handles async pooling instead."""
+        fake = _FakeLitellm()
+        _ensure_pooled_session(fake)
+
+        assert fake.aclient_session is None
+
+    def test_existing_session_preserved(self) -> None:
+        """A user-configured session must not be replaced."""
+        fake = _FakeLitellm()
+        sync_client = httpx.Client()
+        fake.client_session = sync_client
+
+        _ensure_pooled_session(fake)
+
+        assert fake.client_session is sync_client
+
+    def test_idempotent(self) -> None:
+        """Repeated calls keep the first pooled client."""
+        fake = _FakeLitellm()
+        _ensure_pooled_session(fake)
+        first = fake.client_session
+
+        _ensure_pooled_session(fake)
+
+        assert fake.client_session is first
@@ -0,0 +1,26 @@
+"""Tests for deferred heavy imports."""
+
+import subprocess
+import sys
+
+
+class TestLazyLitellmImport:
+    """Importing the package must not pull in litellm's dependency graph."""
+
+    def test_package_import_does_not_load_litellm(self) -> None:
+        """Checked in a subprocess since litellm is loaded by other tests."""
+        code = (
+            "import sys; import pytest_llm_assert; "
+            "sys.exit(1 if 'litellm' in sys.modules else 0)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+        assert result.returncode == 0, "importing pytest_llm_assert loaded litellm"
+
+    def test_plugin_import_does_not_load_litellm(self) -> None:
+        """The pytest11 entry point module must stay cheap for collection."""
+        code = (
+            "import sys; import pytest_llm_assert.plugin; "
+            "sys.exit(1 if 'litellm' in sys.modules else 0)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+        assert result.returncode == 0, "importing the plugin loaded litellm"
@@ -2,27 +2,57 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from typing import Any
+from unittest.mock import patch
+
+import pytest
 
 from pytest_llm_assert.core import LLMAssert
+from tests.unit.conftest import fake_response
+
+# Shared long-content samples, built once per module
+_LONG_150 = "A" * 150
+_EXACT_100 = "A" * 100
+_LONG_200 = "X" * 200
 
 
 class TestEnvExpansion:
     """Environment variable expansion in API keys."""
 
-    def test_expands_env_variable(self) -> None:
-        with patch.dict("os.environ", {"TEST_KEY": "secret123"}):
-            expanded = LLMAssert._expand_env("Bearer ${TEST_KEY}")
-            assert expanded == "Bearer secret123"
+    def test_expands_env_variable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("TEST_KEY", "secret123")
+        expanded = LLMAssert._expand_env("Bearer ${TEST_KEY}")
+        assert expanded == "Bearer secret123"
 
     def test_missing_var_unchanged(self) -> None:
         expanded = LLMAssert._expand_env("${NONEXISTENT_VAR}")
         assert expanded == "${NONEXISTENT_VAR}"
 
-    def test_multiple_vars(self) -> None:
-        with patch.dict("os.environ", {"A": "first", "B": "second"}):
-            expanded = LLMAssert._expand_env("${A}-${B}")
-            assert expanded == "first-second"
+    def test_multiple_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("A", "first")
+        monkeypatch.setenv("B", "second")
+        expanded = LLMAssert._expand_env("${A}-${B}")
+        assert expanded == "first-second"
+
+    def test_no_placeholder_skips_regex(self) -> None:
+        """Plain keys bypass substitution and return the same object."""
+        value = "sk-plain-api-key"
+        assert LLMAssert._expand_env(value) is value
+
+    def test_bare_dollar_skips_regex(self) -> None:
+        """A $ without a ${...} placeholder takes the identity fast path."""
+        value = "price is $5"
+        assert LLMAssert._expand_env(value) is value
+
+    def test_expansion_memoized(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Repeated templates hit the lru_cache instead of re-substituting."""
+        from pytest_llm_assert.core import _expand_env_template
+
+        monkeypatch.setenv("MEMO_KEY", "value")
+        LLMAssert._expand_env("${MEMO_KEY}")
+        LLMAssert._expand_env("${MEMO_KEY}")
+
+        assert _expand_env_template.cache_info().hits >= 1
 
 
 class TestTruncation:
@@ -33,14 +63,17 @@ class TestTruncation:
         assert LLMAssert._truncate(text) == text
 
     def test_long_text_truncated(self) -> None:
-        text = "A" * 150
-        truncated = LLMAssert._truncate(text, max_len=100)
+        truncated = LLMAssert._truncate(_LONG_150, max_len=100)
         assert len(truncated) == 100
         assert truncated.endswith("...")
 
     def test_exact_length_unchanged(self) -> None:
-        text = "A" * 100
-        assert LLMAssert._truncate(text, max_len=100) == text
+        assert LLMAssert._truncate(_EXACT_100, max_len=100) == _EXACT_100
+
+    def test_short_text_no_allocation(self) -> None:
+        """Short content returns the original object, not a copy."""
+        text = "Short text"
+        assert LLMAssert._truncate(text) is text
 
 
 class TestSystemPrompt:
@@ -51,28 +84,28 @@ class TestSystemPrompt:
         assert "assertion evaluator" in llm.system_prompt.lower()
         assert "JSON" in llm.system_prompt
 
+    def test_no_prompt_file_read_on_init(self) -> None:
+        """Default prompts load once at import time, not per construction."""
+        with patch("pathlib.Path.read_text", side_effect=AssertionError("file read")):
+            llm = LLMAssert(model="test/model")
+        assert "assertion evaluator" in llm.system_prompt.lower()
+
     def test_custom_prompt_setter(self) -> None:
         llm = LLMAssert(model="test/model")
         custom = "You are a custom evaluator."
         llm.system_prompt = custom
         assert llm.system_prompt == custom
 
-    def test_prompt_used_in_messages(self) -> None:
+    def test_prompt_used_in_messages(self, mock_completion: Any) -> None:
         """Custom prompt should be used in LLM call."""
-        with patch("pytest_llm_assert.core.litellm.completion") as mock_completion:
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock()]
-            mock_response.choices[0].message.content = "PASS"
-            mock_completion.return_value = mock_response
+        mock_completion.next_response = fake_response("PASS")
 
-            llm = LLMAssert(model="test/model")
-            llm.system_prompt = "CUSTOM_PROMPT_MARKER"
-            llm("content", "criterion")
+        llm = LLMAssert(model="test/model")
+        llm.system_prompt = "CUSTOM_PROMPT_MARKER"
+        llm("content", "criterion")
 
-            call_args = mock_completion.call_args
-            messages = call_args.kwargs.get("messages") or call_args[1].get("messages")
-            system_msg = messages[0]
-            assert system_msg["content"] == "CUSTOM_PROMPT_MARKER"
+        system_msg = mock_completion.calls[-1]["messages"][0]
+        assert system_msg["content"] == "CUSTOM_PROMPT_MARKER"
 
 
 class TestInitialization:
@@ -86,15 +119,21 @@ class TestInitialization:
         llm = LLMAssert(model="anthropic/claude-3")
         assert llm.model == "anthropic/claude-3"
 
-    def test_api_key_expansion(self) -> None:
-        with patch.dict("os.environ", {"MY_KEY": "secret"}):
-            llm = LLMAssert(model="test", api_key="${MY_KEY}")
-            assert llm.api_key == "secret"
+    def test_api_key_expansion(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("MY_KEY", "secret")
+        llm = LLMAssert(model="test", api_key="${MY_KEY}")
+        assert llm.api_key == "secret"
 
     def test_kwargs_stored(self) -> None:
         llm = LLMAssert(model="test", temperature=0.5, max_tokens=100)
         assert llm.kwargs == {"temperature": 0.5, "max_tokens": 100}
 
+    def test_deterministic_defaults(self) -> None:
+        """Verdicts default to temperature=0 and a short max_tokens cap."""
+        llm = LLMAssert(model="test")
+        assert llm.kwargs["temperature"] == 0
+        assert llm.kwargs["max_tokens"] == 128
+
     def test_response_initially_none(self) -> None:
         llm = LLMAssert(model="test")
         assert llm.response is None
@@ -103,97 +142,66 @@ class TestInitialization:
 class TestLLMCall:
     """LLM call behavior with mocked responses."""
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_pass_result(self, mock_completion: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "PASS\nThe content is a greeting."
-        mock_completion.return_value = mock_response
+    @pytest.mark.parametrize(
+        ("response_content", "passed"),
+        [
+            ("PASS\nThe content is a greeting.", True),
+            ("FAIL\nNot a greeting.", False),
+            (None, False),  # empty/None LLM content fails
+            ("PASS", True),  # bare verdict without reasoning
+        ],
+    )
+    def test_verdict_from_response(
+        self,
+        mock_completion: Any,
+        llm: LLMAssert,
+        response_content: str | None,
+        passed: bool,
+    ) -> None:
+        mock_completion.next_response = fake_response(response_content)
 
-        llm = LLMAssert(model="test/model")
         result = llm("Hello world", "Is this a greeting?")
 
-        assert result.passed is True
-        assert result.criterion == "Is this a greeting?"
-        assert "greeting" in result.reasoning.lower()
-
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_fail_result(self, mock_completion: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "FAIL\nNot a greeting."
-        mock_completion.return_value = mock_response
-
-        llm = LLMAssert(model="test/model")
-        result = llm("Goodbye", "Is this a greeting?")
-
-        assert result.passed is False
-
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_empty_content_is_fail(self, mock_completion: MagicMock) -> None:
-        """Handle LLM returning empty/None content."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = None
-        mock_completion.return_value = mock_response
-
-        llm = LLMAssert(model="test/model")
-        result = llm("Content", "criterion")
+        assert result.passed is passed
 
-        assert result.passed is False
-
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_no_reasoning_ok(self, mock_completion: MagicMock) -> None:
-        """Handle response with just PASS/FAIL and no reasoning."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "PASS"
-        mock_completion.return_value = mock_response
+    def test_result_carries_criterion_and_reasoning(
+        self, mock_completion: Any, llm: LLMAssert
+    ) -> None:
+        mock_completion.next_response = fake_response(
+            "PASS\nThe content is a greeting."
+        )
 
-        llm = LLMAssert(model="test/model")
-        result = llm("Content", "criterion")
+        result = llm("Hello world", "Is this a greeting?")
 
-        assert result.passed is True
+        assert result.criterion == "Is this a greeting?"
+        assert "greeting" in result.reasoning.lower()
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_kwargs_passed_to_litellm(self, mock_completion: MagicMock) -> None:
+    def test_kwargs_passed_to_litellm(self, mock_completion: Any) -> None:
         """Additional kwargs should be passed to litellm.completion."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "PASS"
-        mock_completion.return_value = mock_response
+        mock_completion.next_response = fake_response("PASS")
 
         llm = LLMAssert(model="test/model", temperature=0, max_tokens=50)
         llm("content", "criterion")
 
-        call_kwargs = mock_completion.call_args.kwargs
+        call_kwargs = mock_completion.calls[-1]
         assert call_kwargs.get("temperature") == 0
         assert call_kwargs.get("max_tokens") == 50
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_content_preview_in_result(self, mock_completion: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "PASS"
-        mock_completion.return_value = mock_response
+    def test_content_preview_in_result(
+        self, mock_completion: Any, llm: LLMAssert
+    ) -> None:
+        mock_completion.next_response = fake_response("PASS")
 
-        llm = LLMAssert(model="test/model")
         result = llm("Hello world", "criterion")
 
         assert result.content_preview == "Hello world"
 
-    @patch("pytest_llm_assert.core.litellm.completion")
     def test_long_content_truncated_in_preview(
-        self, mock_completion: MagicMock
+        self, mock_completion: Any, llm: LLMAssert
     ) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "PASS"
-        mock_completion.return_value = mock_response
+        mock_completion.next_response = fake_response("PASS")
 
-        llm = LLMAssert(model="test/model")
-        long_content = "X" * 200
-        result = llm(long_content, "criterion")
+        result = llm(_LONG_200, "criterion")
 
         assert len(result.content_preview) == 100
         assert result.content_preview.endswith("...")
@@ -0,0 +1,72 @@
+"""Tests for prefilter short-circuiting."""
+
+from typing import Any
+
+from pytest_llm_assert.core import LLMAssert, empty_content_fails
+from tests.unit.conftest import fake_response
+
+
+class TestPrefilters:
+    """Cheap deciders run before the LLM call."""
+
+    def test_true_verdict_skips_llm(self, mock_completion: Any) -> None:
+        llm = LLMAssert(model="test/model", prefilters=[lambda c, k: True])
+        result = llm("content", "criterion")
+
+        assert result.passed is True
+        assert mock_completion.calls == []
+
+    def test_false_verdict_skips_llm(self, mock_completion: Any) -> None:
+        llm = LLMAssert(model="test/model", prefilters=[lambda c, k: False])
+        result = llm("content", "criterion")
+
+        assert result.passed is False
+        assert mock_completion.calls == []
+
+    def test_none_falls_through_to_llm(self, mock_completion: Any) -> None:
+        mock_completion.next_response = fake_response(
+            '{"result": "PASS", "reasoning": "From LLM"}'
+        )
+
+        llm = LLMAssert(model="test/model", prefilters=[lambda c, k: None])
+        result = llm("content", "criterion")
+
+        assert result.passed is True
+        assert result.reasoning == "From LLM"
+        assert len(mock_completion.calls) == 1
+
+    def test_first_decider_wins(self) -> None:
+        def undecided(content: str, criterion: str) -> bool | None:
+            return None
+
+        def rejects(content: str, criterion: str) -> bool | None:
+            return False
+
+        def accepts(content: str, criterion: str) -> bool | None:
+            return True
+
+        llm = LLMAssert(model="test/model", prefilters=[undecided, rejects, accepts])
+        result = llm("content", "criterion")
+
+        assert result.passed is False
+        assert "rejects" in result.reasoning
+
+
+class TestEmptyContentFails:
+    """Stock prefilter for empty content."""
+
+    def test_empty_string_fails(self) -> None:
+        assert empty_content_fails("", "criterion") is False
+
+    def test_whitespace_fails(self) -> None:
+        assert empty_content_fails("   \n\t", "criterion") is False
+
+    def test_nonempty_undecided(self) -> None:
+        assert empty_content_fails("some text", "criterion") is None
+
+    def test_integrates_with_call(self, mock_completion: Any) -> None:
+        llm = LLMAssert(model="test/model", prefilters=[empty_content_fails])
+        result = llm("", "Does this indicate success?")
+
+        assert result.passed is False
+        assert mock_completion.calls == []
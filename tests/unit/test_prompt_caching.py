@@ -0,0 +1,47 @@
+"""Tests for provider-native prompt caching of the system message."""
+
+from typing import Any
+
+from pytest_llm_assert.core import LLMAssert
+from tests.unit.conftest import fake_response
+
+
+class TestCacheControl:
+    """cache_control markers are applied only for supporting models."""
+
+    def test_anthropic_system_msg_tagged(self) -> None:
+        llm = LLMAssert(model="anthropic/claude-sonnet-4-20250514")
+        system = llm._system_msg
+
+        assert isinstance(system["content"], list)
+        block = system["content"][0]
+        assert block["cache_control"] == {"type": "ephemeral"}
+        assert "assertion evaluator" in block["text"].lower()
+
+    def test_bedrock_anthropic_tagged(self) -> None:
+        llm = LLMAssert(model="bedrock/anthropic.claude-3-sonnet")
+        assert isinstance(llm._system_msg["content"], list)
+
+    def test_openai_system_msg_plain(self) -> None:
+        """OpenAI caches long prefixes automatically; keep the string form."""
+        llm = LLMAssert(model="openai/gpt-5-mini")
+        assert isinstance(llm._system_msg["content"], str)
+
+    def test_custom_prompt_keeps_tag(self) -> None:
+        llm = LLMAssert(model="anthropic/claude-sonnet-4-20250514")
+        llm.system_prompt = "Custom evaluator prompt"
+
+        block = llm._system_msg["content"][0]
+        assert block["text"] == "Custom evaluator prompt"
+        assert block["cache_control"] == {"type": "ephemeral"}
+
+    def test_tagged_message_sent_to_litellm(self, mock_completion: Any) -> None:
+        mock_completion.next_response = fake_response(
+            '{"result": "PASS", "reasoning": "OK"}'
+        )
+
+        llm = LLMAssert(model="anthropic/claude-sonnet-4-20250514")
+        llm("content", "criterion")
+
+        system = mock_completion.calls[-1]["messages"][0]
+        assert system["content"][0]["cache_control"] == {"type": "ephemeral"}
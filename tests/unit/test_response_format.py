@@ -0,0 +1,86 @@
+"""Tests for forced JSON output via response_format."""
+
+from unittest.mock import MagicMock, patch
+
+from pytest_llm_assert.core import LLMAssert
+from tests.unit.conftest import fake_response
+
+
+class TestResponseFormat:
+    """response_format is sent only when the model supports it."""
+
+    @patch("pytest_llm_assert.core.litellm.supports_response_schema")
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_sent_when_supported(
+        self, mock_completion: MagicMock, mock_supports: MagicMock
+    ) -> None:
+        mock_supports.return_value = True
+        mock_completion.return_value = fake_response(
+            '{"result": "PASS", "reasoning": "OK"}'
+        )
+
+        llm = LLMAssert(model="test/model")
+        llm("content", "criterion")
+
+        sent = mock_completion.call_args.kwargs.get("response_format")
+        assert sent["type"] == "json_schema"
+        schema = sent["json_schema"]["schema"]
+        assert schema["properties"]["result"]["enum"] == ["PASS", "FAIL"]
+        assert schema["required"] == ["result", "reasoning"]
+
+    @patch("pytest_llm_assert.core.litellm.supports_response_schema")
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_omitted_when_unsupported(
+        self, mock_completion: MagicMock, mock_supports: MagicMock
+    ) -> None:
+        mock_supports.return_value = False
+        mock_completion.return_value = fake_response("PASS")
+
+        llm = LLMAssert(model="test/model")
+        llm("content", "criterion")
+
+        assert "response_format" not in mock_completion.call_args.kwargs
+
+    @patch("pytest_llm_assert.core.litellm.supports_response_schema")
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_omitted_when_lookup_fails(
+        self, mock_completion: MagicMock, mock_supports: MagicMock
+    ) -> None:
+        """Unknown models must not break the call."""
+        mock_supports.side_effect = Exception("unknown model")
+        mock_completion.return_value = fake_response("PASS")
+
+        llm = LLMAssert(model="test/model")
+        llm("content", "criterion")
+
+        assert "response_format" not in mock_completion.call_args.kwargs
+
+    @patch("pytest_llm_assert.core.litellm.supports_response_schema")
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_user_override_wins(
+        self, mock_completion: MagicMock, mock_supports: MagicMock
+    ) -> None:
+        mock_supports.return_value = True
+        mock_completion.return_value = fake_response("PASS")
+
+        custom = {"type": "text"}
+        llm = LLMAssert(model="test/model", response_format=custom)
+        llm("content", "criterion")
+
+        assert mock_completion.call_args.kwargs["response_format"] == custom
+
+    @patch("pytest_llm_assert.core.litellm.supports_response_schema")
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_support_checked_once(
+        self, mock_completion: MagicMock, mock_supports: MagicMock
+    ) -> None:
+        mock_supports.return_value = True
+        mock_completion.return_value = fake_response(
+            '{"result": "PASS", "reasoning": "OK"}'
+        )
+
+        llm = LLMAssert(model="test/model")
+        llm("content", "criterion")
+        llm("content 2", "criterion")
+
+        assert mock_supports.call_count == 1
@@ -1,72 +1,57 @@
 """Tests for LLM response parsing."""
 
-from unittest.mock import MagicMock, patch
+from typing import Any
+
+import pytest
 
 from pytest_llm_assert.core import LLMAssert
+from tests.unit.conftest import fake_response
 
 
 class TestJsonParsing:
     """JSON response parsing from LLM."""
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_parses_json_pass(self, mock_completion: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[
-            0
-        ].message.content = '{"result": "PASS", "reasoning": "Looks good"}'
-        mock_completion.return_value = mock_response
+    def test_parses_json_pass(self, mock_completion: Any, llm: LLMAssert) -> None:
+        mock_completion.next_response = fake_response(
+            '{"result": "PASS", "reasoning": "Looks good"}'
+        )
 
-        llm = LLMAssert(model="test/model")
         result = llm("content", "criterion")
 
         assert result.passed is True
         assert result.reasoning == "Looks good"
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_parses_json_fail(self, mock_completion: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[
-            0
-        ].message.content = '{"result": "FAIL", "reasoning": "Does not meet criterion"}'
-        mock_completion.return_value = mock_response
+    def test_parses_json_fail(self, mock_completion: Any, llm: LLMAssert) -> None:
+        mock_completion.next_response = fake_response(
+            '{"result": "FAIL", "reasoning": "Does not meet criterion"}'
+        )
 
-        llm = LLMAssert(model="test/model")
         result = llm("content", "criterion")
 
         assert result.passed is False
         assert result.reasoning == "Does not meet criterion"
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_parses_json_in_markdown_block(self, mock_completion: MagicMock) -> None:
+    def test_parses_json_in_markdown_block(
+        self, mock_completion: Any, llm: LLMAssert
+    ) -> None:
         """LLMs sometimes wrap JSON in markdown code blocks."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[
-            0
-        ].message.content = '```json\n{"result": "PASS", "reasoning": "Valid"}\n```'
-        mock_completion.return_value = mock_response
-
-        llm = LLMAssert(model="test/model")
+        mock_completion.next_response = fake_response(
+            '```json\n{"result": "PASS", "reasoning": "Valid"}\n```'
+        )
+
         result = llm("content", "criterion")
 
         assert result.passed is True
         assert result.reasoning == "Valid"
 
-    @patch("pytest_llm_assert.core.litellm.completion")
     def test_parses_json_in_plain_markdown_block(
-        self, mock_completion: MagicMock
+        self, mock_completion: Any, llm: LLMAssert
     ) -> None:
         """Handle markdown blocks without json language specifier."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[
-            0
-        ].message.content = '```\n{"result": "PASS", "reasoning": "OK"}\n```'
-        mock_completion.return_value = mock_response
-
-        llm = LLMAssert(model="test/model")
+        mock_completion.next_response = fake_response(
+            '```\n{"result": "PASS", "reasoning": "OK"}\n```'
+        )
+
         result = llm("content", "criterion")
 
         assert result.passed is True
@@ -75,44 +60,31 @@ class TestJsonParsing:
 class TestFallbackParsing:
     """Fallback line-based parsing when JSON fails."""
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_fallback_pass_variations(self, mock_completion: MagicMock) -> None:
+    @pytest.mark.parametrize(
+        "indicator", ["PASS", "YES", "TRUE", "PASSED", "pass", "yes", "true"]
+    )
+    def test_fallback_pass_variations(
+        self, mock_completion: Any, llm: LLMAssert, indicator: str
+    ) -> None:
         """Various pass indicators should be recognized."""
-        pass_indicators = ["PASS", "YES", "TRUE", "PASSED", "pass", "yes", "true"]
-
-        for indicator in pass_indicators:
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock()]
-            mock_response.choices[0].message.content = f"{indicator}\nReasoning here"
-            mock_completion.return_value = mock_response
+        mock_completion.next_response = fake_response(f"{indicator}\nReasoning here")
 
-            llm = LLMAssert(model="test/model")
-            result = llm("content", "criterion")
+        result = llm("content", "criterion")
 
-            assert result.passed is True, f"Failed for indicator: {indicator}"
+        assert result.passed is True, f"Failed for indicator: {indicator}"
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_fallback_fail(self, mock_completion: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "FAIL\nDoes not match"
-        mock_completion.return_value = mock_response
+    def test_fallback_fail(self, mock_completion: Any, llm: LLMAssert) -> None:
+        mock_completion.next_response = fake_response("FAIL\nDoes not match")
 
-        llm = LLMAssert(model="test/model")
         result = llm("content", "criterion")
 
         assert result.passed is False
         assert result.reasoning == "Does not match"
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_fallback_no_newline(self, mock_completion: MagicMock) -> None:
+    def test_fallback_no_newline(self, mock_completion: Any, llm: LLMAssert) -> None:
         """Single line response should use whole response as reasoning."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "UNKNOWN_RESPONSE"
-        mock_completion.return_value = mock_response
+        mock_completion.next_response = fake_response("UNKNOWN_RESPONSE")
 
-        llm = LLMAssert(model="test/model")
         result = llm("content", "criterion")
 
         assert result.passed is False  # Not a recognized pass indicator
@@ -122,22 +94,16 @@ class TestFallbackParsing:
 class TestResponseMetadata:
     """LLM response metadata capture."""
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_captures_usage_stats(self, mock_completion: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "PASS"
-        mock_response.model = "gpt-4"
-        mock_response.id = "chatcmpl-123"
-        mock_response.created = 1234567890
-        mock_response.usage = MagicMock()
-        mock_response.usage.prompt_tokens = 100
-        mock_response.usage.completion_tokens = 50
-        mock_response.usage.total_tokens = 150
-        mock_response._hidden_params = {"response_cost": 0.002}
-        mock_completion.return_value = mock_response
-
-        llm = LLMAssert(model="test/model")
+    def test_captures_usage_stats(self, mock_completion: Any, llm: LLMAssert) -> None:
+        mock_completion.next_response = fake_response(
+            "PASS",
+            model="gpt-4",
+            response_id="chatcmpl-123",
+            created=1234567890,
+            usage={"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150},
+            cost=0.002,
+        )
+
         llm("content", "criterion")
 
         assert llm.response is not None
@@ -149,39 +115,24 @@ class TestResponseMetadata:
         assert llm.response.total_tokens == 150
         assert llm.response.cost == 0.002
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_handles_missing_usage(self, mock_completion: MagicMock) -> None:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "PASS"
-        mock_response.model = "test-model"
-        mock_response.id = None
-        mock_response.created = None
-        mock_response.usage = None
-        # No _hidden_params
-        del mock_response._hidden_params
-        mock_completion.return_value = mock_response
-
-        llm = LLMAssert(model="test/model")
+    def test_handles_missing_usage(self, mock_completion: Any, llm: LLMAssert) -> None:
+        # No usage and no _hidden_params attribute
+        mock_completion.next_response = fake_response("PASS", model="test-model")
+
         llm("content", "criterion")
 
         assert llm.response is not None
         assert llm.response.prompt_tokens is None
         assert llm.response.cost is None
 
-    @patch("pytest_llm_assert.core.litellm.completion")
-    def test_handles_no_hidden_params(self, mock_completion: MagicMock) -> None:
+    def test_handles_no_hidden_params(
+        self, mock_completion: Any, llm: LLMAssert
+    ) -> None:
         """Handle responses without _hidden_params attribute."""
-        mock_response = MagicMock(spec=["choices", "model", "id", "created", "usage"])
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "PASS"
-        mock_response.model = "test"
-        mock_response.id = None
-        mock_response.created = None
-        mock_response.usage = None
-        mock_completion.return_value = mock_response
-
-        llm = LLMAssert(model="test/model")
+        # fake_response only grows _hidden_params when a cost is given,
+        # so this exercises the genuinely-absent-attribute path
+        mock_completion.next_response = fake_response("PASS", model="test")
+
         llm("content", "criterion")
 
         assert llm.response.cost is None
@@ -0,0 +1,150 @@
+"""Tests for provider batch-API evaluation."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pytest_llm_assert.core import LLMAssert
+
+
+def _output_line(custom_id: str, result: str, reasoning: str) -> str:
+    return json.dumps(
+        {
+            "custom_id": custom_id,
+            "response": {
+                "body": {
+                    "choices": [
+                        {
+                            "message": {
+                                "content": json.dumps(
+                                    {"result": result, "reasoning": reasoning}
+                                )
+                            }
+                        }
+                    ]
+                }
+            },
+        }
+    )
+
+
+def _completed_batch(output: str) -> tuple[MagicMock, MagicMock, MagicMock]:
+    """Build (file, batch, file_content) mocks for a completed batch."""
+    input_file = MagicMock()
+    input_file.id = "file-123"
+
+    batch = MagicMock()
+    batch.id = "batch-123"
+    batch.status = "completed"
+    batch.output_file_id = "file-456"
+
+    content = MagicMock()
+    content.content = output.encode()
+    return input_file, batch, content
+
+
+class TestRunBatch:
+    """Offline evaluation through the provider's batch endpoint."""
+
+    @patch("pytest_llm_assert.core.litellm.file_content")
+    @patch("pytest_llm_assert.core.litellm.create_batch")
+    @patch("pytest_llm_assert.core.litellm.create_file")
+    def test_results_in_input_order(
+        self,
+        mock_create_file: MagicMock,
+        mock_create_batch: MagicMock,
+        mock_file_content: MagicMock,
+    ) -> None:
+        output = "\n".join(
+            [
+                _output_line("1", "FAIL", "Second"),  # out of order on purpose
+                _output_line("0", "PASS", "First"),
+            ]
+        )
+        input_file, batch, content = _completed_batch(output)
+        mock_create_file.return_value = input_file
+        mock_create_batch.return_value = batch
+        mock_file_content.return_value = content
+
+        llm = LLMAssert(model="openai/gpt-5-mini")
+        results = llm.run_batch([("A", "crit A"), ("B", "crit B")])
+
+        assert results[0].passed is True
+        assert results[0].reasoning == "First"
+        assert results[1].passed is False
+        assert results[1].criterion == "crit B"
+
+    @patch("pytest_llm_assert.core.litellm.file_content")
+    @patch("pytest_llm_assert.core.litellm.create_batch")
+    @patch("pytest_llm_assert.core.litellm.create_file")
+    def test_jsonl_lines_carry_custom_ids(
+        self,
+        mock_create_file: MagicMock,
+        mock_create_batch: MagicMock,
+        mock_file_content: MagicMock,
+    ) -> None:
+        input_file, batch, content = _completed_batch(_output_line("0", "PASS", "OK"))
+        mock_create_file.return_value = input_file
+        mock_create_batch.return_value = batch
+        mock_file_content.return_value = content
+
+        llm = LLMAssert(model="openai/gpt-5-mini")
+        llm.run_batch([("content", "criterion")])
+
+        _, payload = mock_create_file.call_args.kwargs["file"]
+        line = json.loads(payload.decode())
+        assert line["custom_id"] == "0"
+        assert line["url"] == "/v1/chat/completions"
+        assert line["body"]["model"] == "gpt-5-mini"
+        assert "criterion" in line["body"]["messages"][1]["content"]
+
+    @patch("pytest_llm_assert.core.litellm.retrieve_batch")
+    @patch("pytest_llm_assert.core.litellm.create_batch")
+    @patch("pytest_llm_assert.core.litellm.create_file")
+    def test_failed_batch_raises(
+        self,
+        mock_create_file: MagicMock,
+        mock_create_batch: MagicMock,
+        mock_retrieve_batch: MagicMock,
+    ) -> None:
+        input_file = MagicMock()
+        input_file.id = "file-123"
+        mock_create_file.return_value = input_file
+
+        failed = MagicMock()
+        failed.id = "batch-123"
+        failed.status = "failed"
+        mock_create_batch.return_value = failed
+
+        llm = LLMAssert(model="openai/gpt-5-mini")
+        with pytest.raises(RuntimeError, match="failed"):
+            llm.run_batch([("content", "criterion")])
+        mock_retrieve_batch.assert_not_called()
+
+    @patch("pytest_llm_assert.core.litellm.file_content")
+    @patch("pytest_llm_assert.core.litellm.create_batch")
+    @patch("pytest_llm_assert.core.litellm.create_file")
+    def test_missing_output_line_fails_item(
+        self,
+        mock_create_file: MagicMock,
+        mock_create_batch: MagicMock,
+        mock_file_content: MagicMock,
+    ) -> None:
+        input_file, batch, content = _completed_batch(_output_line("0", "PASS", "OK"))
+        mock_create_file.return_value = input_file
+        mock_create_batch.return_value = batch
+        mock_file_content.return_value = content
+
+        llm = LLMAssert(model="openai/gpt-5-mini")
+        results = llm.run_batch([("A", "crit"), ("B", "crit")])
+
+        assert results[0].passed is True
+        assert results[1].passed is False
+        assert "No output" in results[1].reasoning
+
+    def test_empty_items_no_calls(self) -> None:
+        with patch("pytest_llm_assert.core.litellm.create_file") as mock_create_file:
+            llm = LLMAssert(model="openai/gpt-5-mini")
+            assert llm.run_batch([]) == []
+            mock_create_file.assert_not_called()
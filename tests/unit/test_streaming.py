@@ -0,0 +1,85 @@
+"""Tests for fast_fail streaming with early verdict exit."""
+
+from unittest.mock import MagicMock, patch
+
+from pytest_llm_assert.core import LLMAssert
+from tests.unit.conftest import fake_response
+
+
+def _chunk(delta_content: str | None) -> MagicMock:
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = delta_content
+    return chunk
+
+
+class TestFastFailStreaming:
+    """Streamed responses stop as soon as the verdict is decoded."""
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_streams_when_fast_fail(self, mock_completion: MagicMock) -> None:
+        mock_completion.return_value = iter(
+            [_chunk('{"result": "PASS"'), _chunk(', "reasoning": "OK"}')]
+        )
+
+        llm = LLMAssert(model="test/model", fast_fail=True)
+        result = llm("content", "criterion")
+
+        assert result.passed is True
+        assert mock_completion.call_args.kwargs.get("stream") is True
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_stops_reading_after_verdict(self, mock_completion: MagicMock) -> None:
+        """Chunks after the verdict should never be consumed."""
+        consumed = []
+
+        def chunks():
+            for i, text in enumerate(
+                ['{"result": "FAIL"', ', "reasoning": "long', ' tail of reasoning"}']
+            ):
+                consumed.append(i)
+                yield _chunk(text)
+
+        mock_completion.return_value = chunks()
+
+        llm = LLMAssert(model="test/model", fast_fail=True)
+        result = llm("content", "criterion")
+
+        assert result.passed is False
+        assert consumed == [0]  # verdict decoded from the first chunk
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_partial_reasoning_extracted(self, mock_completion: MagicMock) -> None:
+        mock_completion.return_value = iter(
+            [_chunk('{"result": "PASS", "reasoning": "partial expl')]
+        )
+
+        llm = LLMAssert(model="test/model", fast_fail=True)
+        result = llm("content", "criterion")
+
+        assert result.passed is True
+        assert result.reasoning == "partial expl"
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_response_metadata_from_chunks(self, mock_completion: MagicMock) -> None:
+        chunk = _chunk('{"result": "PASS"}')
+        chunk.model = "gpt-4"
+        chunk.id = "chatcmpl-stream"
+        chunk.created = 1234567890
+        mock_completion.return_value = iter([chunk])
+
+        llm = LLMAssert(model="test/model", fast_fail=True)
+        llm("content", "criterion")
+
+        assert llm.response is not None
+        assert llm.response.model == "gpt-4"
+        assert llm.response.response_id == "chatcmpl-stream"
+
+    @patch("pytest_llm_assert.core.litellm.completion")
+    def test_disabled_by_default(self, mock_completion: MagicMock) -> None:
+        mock_completion.return_value = fake_response("PASS")
+
+        llm = LLMAssert(model="test/model")
+        llm("content", "criterion")
+
+        assert "stream" not in mock_completion.call_args.kwargs